@@ -0,0 +1,59 @@
+from functools import lru_cache
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+
+def _truncate_tracks(
+        offsets: np.ndarray,
+        durations: np.ndarray,
+        offset: float,
+        new_mix_end: float,
+        old_duration: float,
+        has_duration: bool
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Numeric core of `MixedCut.truncate`, operating on the arrays of track offsets and cut durations.
+    Returns a tuple of `(keep_mask, cut_offsets, new_durations, track_offsets)` - see `MixedCut.truncate`
+    for the meaning of these values.
+    """
+    num_tracks = offsets.shape[0]
+    keep_mask = np.zeros(num_tracks, dtype=np.bool_)
+    cut_offsets = np.zeros(num_tracks, dtype=np.float64)
+    new_durations = np.zeros(num_tracks, dtype=np.float64)
+    track_offsets = np.zeros(num_tracks, dtype=np.float64)
+    for i in range(num_tracks):
+        cut_offset = max(offset - offsets[i], 0.0)
+        track_offset = max(offsets[i] - offset, 0.0)
+        track_end = offsets[i] + durations[i]
+        if track_end < offset:
+            continue
+        cut_duration_decrease = 0.0
+        if track_end > new_mix_end:
+            if has_duration:
+                cut_duration_decrease = track_end - new_mix_end
+            else:
+                cut_duration_decrease = track_end - old_duration
+        new_duration = durations[i] - cut_offset - cut_duration_decrease
+        if new_duration <= 0:
+            continue
+        keep_mask[i] = True
+        cut_offsets[i] = cut_offset
+        new_durations[i] = new_duration
+        track_offsets[i] = track_offset
+    return keep_mask, cut_offsets, new_durations, track_offsets
+
+
+@lru_cache(maxsize=1)
+def get_truncate_tracks() -> Optional[Callable]:
+    """
+    Return the numba-compiled `_truncate_tracks` kernel, or None when numba is not installed.
+    The kernel is only worth it when compiled - otherwise it is slower than the plain Python loop.
+    Numba is imported on the first call rather than with `lhotse.cut`, as importing it is slow
+    and the kernel is only needed for mixes with many tracks.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    return njit(cache=True)(_truncate_tracks)
@@ -23,6 +23,8 @@ class AudioSource:
     - 'file' (formats supported by librosa, possibly multi-channel)
     - 'command' [unix pipe] (must be WAVE, possibly multi-channel)
     """
+    __slots__ = ('type', 'channel_ids', 'source')
+
     type: str
     channel_ids: List[int]
     source: str
@@ -83,6 +85,8 @@ class Recording:
     """
     Recording represents an AudioSource along with some metadata.
     """
+    __slots__ = ('id', 'sources', 'sampling_rate', 'num_samples', 'duration_seconds')
+
     id: str
     sources: List[AudioSource]
     sampling_rate: int
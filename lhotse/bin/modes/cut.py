@@ -1,27 +1,48 @@
-from typing import Tuple, Optional, List
+import os
+import random
+from collections import defaultdict, deque
+from concurrent.futures import Executor
+from concurrent.futures.process import ProcessPoolExecutor
+from concurrent.futures.thread import ThreadPoolExecutor
+from functools import partial
+from itertools import chain, count
+from typing import Tuple, Optional, List, Sequence, Generator, Callable, Iterable, Any
 
 import click
 import numpy as np
-from cytoolz.itertoolz import groupby
+from cytoolz.itertoolz import partition_all
 
 from lhotse.bin.modes.cli_base import cli
 from lhotse.cut import (
+    AnyCut,
     CutSet,
     make_cuts_from_features,
     make_cuts_from_supervisions,
     make_windowed_cuts_from_features,
     append_cuts,
     mix_cuts,
+    truncate_cut,
 )
 from lhotse.features import FeatureSet
-from lhotse.manipulation import split, combine
+from lhotse.manipulation import split
 from lhotse.supervision import SupervisionSet
-from lhotse.utils import Pathlike, fix_random_seed
+from lhotse.utils import Pathlike, cached_load, Seconds
+
+# The number of cuts truncated with a single random seed (and dispatched to a single worker) in "lhotse cut truncate".
+TRUNCATE_CHUNK_SIZE = 1000
 
 
 @cli.group()
 def cut():
-    """Group of commands used to create CutSets."""
+    """
+    Group of commands used to create CutSets.
+    Manifests with a ".jsonl" (or ".jsonl.gz") extension are read and written as JSON Lines,
+    and with a ".json" (or ".json.gz") extension as JSON; otherwise YAML is used.
+    Feature manifests can't be stored as JSON Lines - they only support the JSON and YAML formats.
+    The parsed feature and supervision manifests are cached in $XDG_CACHE_HOME/lhotse (~/.cache/lhotse by default).
+    The cache keeps a full copy of every manifest that was loaded and is never evicted - remove that directory
+    to free the disk space, or set the LHOTSE_DISABLE_MANIFEST_CACHE environment variable to disable the cache.
+    """
     pass
 
 
@@ -40,13 +61,13 @@ def simple(
     Optionally it can use a SUPERVISION_MANIFEST to select the regions and attach the corresponding supervisions to
     the cuts. This is the simplest way to create Cuts.
     """
-    feature_set = FeatureSet.from_yaml(feature_manifest)
+    feature_set = cached_load(feature_manifest, FeatureSet.from_file)
     if supervision_manifest is None:
         cut_set = make_cuts_from_features(feature_set)
     else:
-        supervision_set = SupervisionSet.from_yaml(supervision_manifest)
+        supervision_set = cached_load(supervision_manifest, SupervisionSet.from_file)
         cut_set = make_cuts_from_supervisions(feature_set=feature_set, supervision_set=supervision_set)
-    cut_set.to_yaml(output_cut_manifest)
+    cut_set.to_file(output_cut_manifest)
 
 
 @cut.command()
@@ -69,14 +90,14 @@ def windowed(
     Create a CutSet stored in OUTPUT_CUT_MANIFEST from feature regions in FEATURE_MANIFEST.
     The feature matrices are traversed in windows with CUT_SHIFT increments, creating cuts of constant CUT_DURATION.
     """
-    feature_set = FeatureSet.from_yaml(feature_manifest)
+    feature_set = cached_load(feature_manifest, FeatureSet.from_file)
     cut_set = make_windowed_cuts_from_features(
         feature_set=feature_set,
         cut_duration=cut_duration,
         cut_shift=cut_shift,
         keep_shorter_windows=keep_shorter_windows
     )
-    cut_set.to_yaml(output_cut_manifest)
+    cut_set.to_file(output_cut_manifest)
 
 
 @cut.command()
@@ -103,30 +124,29 @@ def random_overlayed(
     parts and overlays their features to create a mix.
     The parameters of the mix are controlled via SNR_RANGE and OFFSET_RANGE.
     """
-    fix_random_seed(random_seed)
-
-    supervision_set = SupervisionSet.from_yaml(supervision_manifest)
-    feature_set = FeatureSet.from_yaml(feature_manifest)
+    supervision_set = cached_load(supervision_manifest, SupervisionSet.from_file)
+    feature_set = cached_load(feature_manifest, FeatureSet.from_file)
 
     source_cut_set = make_cuts_from_supervisions(supervision_set=supervision_set, feature_set=feature_set)
-    left_cuts, right_cuts = split(source_cut_set, num_splits=2, randomize=True)
+    left_cuts, right_cuts = split(source_cut_set, num_splits=2, randomize=True, rng=random.Random(random_seed))
 
-    snrs = np.random.uniform(*snr_range, size=len(left_cuts)).tolist()
-    relative_offsets = np.random.uniform(*offset_range, size=len(left_cuts)).tolist()
+    # Use local random generators, rather than the global state, so that the results are reproducible.
+    # The values are converted back with .tolist(), as the numpy scalars would end up in the MixTracks
+    # and could not be serialized to YAML or JSON (orjson).
+    rng = np.random.default_rng(random_seed)
+    snrs = rng.uniform(*snr_range, size=len(left_cuts)).tolist()
+    left_durations = np.fromiter((cut.duration for cut in left_cuts), dtype=np.float64, count=len(left_cuts))
+    offsets = (left_durations * rng.uniform(*offset_range, size=len(left_cuts))).tolist()
 
     overlayed_cut_set = CutSet.from_cuts(
-        left_cut.overlay(
-            right_cut,
-            offset_other_by=left_cut.duration * relative_offset,
-            snr=snr
-        )
-        for left_cut, right_cut, snr, relative_offset in zip(left_cuts, right_cuts, snrs, relative_offsets)
+        left_cut.overlay(right_cut, offset_other_by=offset, snr=snr)
+        for left_cut, right_cut, snr, offset in zip(left_cuts, right_cuts, snrs, offsets)
     )
-    overlayed_cut_set.to_yaml(output_cut_manifest)
+    overlayed_cut_set.to_file(output_cut_manifest)
 
 
 @cut.command()
-@click.argument('cut_manifests', nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.argument('cut_manifests', nargs=-1)
 @click.argument('output_cut_manifest', type=click.Path())
 def mix_sequential(
         cut_manifests: List[Pathlike],
@@ -138,33 +158,42 @@ def mix_sequential(
     The mix is performed by summing the features from all Cuts.
     If the CUT_MANIFESTS have different number of Cuts, the mixing ends when the shorter manifest is depleted.
     """
-    cut_manifests = [CutSet.from_yaml(path) for path in cut_manifests]
-    mixed_cut_set = CutSet.from_cuts(mix_cuts(cuts) for cuts in zip(*cut_manifests))
-    mixed_cut_set.to_yaml(output_cut_manifest)
+    _check_files_exist(cut_manifests, param_hint='CUT_MANIFESTS')
+    CutSet.write_streaming(output_cut_manifest, (mix_cuts(cuts) for cuts in _joint_iter(cut_manifests)))
 
 
 @cut.command()
-@click.argument('cut_manifests', nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.argument('cut_manifests', nargs=-1)
 @click.argument('output_cut_manifest', type=click.Path())
+@click.option('-j', '--num-jobs', type=int, default=1, help='Number of parallel processes used to read CUT_MANIFESTS.')
 def mix_by_recording_id(
         cut_manifests: List[Pathlike],
-        output_cut_manifest: Pathlike
+        output_cut_manifest: Pathlike,
+        num_jobs: int
 ):
     """
     Create a CutSet stored in OUTPUT_CUT_MANIFEST by matching the Cuts from CUT_MANIFESTS by their recording IDs
     and mixing them together.
     """
-    all_cuts = combine(*[CutSet.from_yaml(path) for path in cut_manifests])
-    recording_id_to_cuts = groupby(lambda cut: cut.recording_id, all_cuts)
-    mixed_cut_set = CutSet.from_cuts(mix_cuts(cuts) for recording_id, cuts in recording_id_to_cuts.items())
-    mixed_cut_set.to_yaml(output_cut_manifest)
+    _check_files_exist(cut_manifests, param_hint='CUT_MANIFESTS')
+    if num_jobs == 1 or len(cut_manifests) == 1:
+        # Avoid spawning subprocesses for single threaded processing
+        cut_sets = [CutSet.iter_from_file(path) for path in cut_manifests]
+    else:
+        with ProcessPoolExecutor(min(num_jobs, len(cut_manifests))) as ex:
+            cut_sets = list(ex.map(CutSet.from_file, cut_manifests))
+    recording_id_to_cuts = defaultdict(list)
+    for cut in chain.from_iterable(cut_sets):
+        recording_id_to_cuts[cut.recording_id].append(cut)
+    mixed_cut_set = CutSet.from_cuts(mix_cuts(cuts) for cuts in recording_id_to_cuts.values())
+    mixed_cut_set.to_file(output_cut_manifest)
 
 
 @cut.command(context_settings=dict(show_default=True))
 @click.argument('cut_manifest', type=click.Path(exists=True, dir_okay=False))
 @click.argument('output_cut_manifest', type=click.Path())
 @click.option('--preserve-id', is_flag=True,
-              help='Should the cuts preserve IDs (by default, they will get new, random IDs)')
+              help='Should the cuts preserve IDs (by default, they will get new, unique IDs)')
 @click.option('-d', '--max-duration', type=float, required=True,
               help='The maximum duration in seconds of a cut in the resulting manifest.')
 @click.option('-o', '--offset-type', type=click.Choice(['start', 'end', 'random']), default='start',
@@ -174,6 +203,7 @@ def mix_by_recording_id(
 @click.option('--keep-overflowing-supervisions/--discard-overflowing-supervisions', type=bool, default=False,
               help='When a cut is truncated in the middle of a supervision segment, should the supervision be kept.')
 @click.option('-r', '--random-seed', default=42, type=int, help='Random seed value.')
+@click.option('-j', '--num-jobs', type=int, default=1, help='Number of parallel processes.')
 def truncate(
         cut_manifest: Pathlike,
         output_cut_manifest: Pathlike,
@@ -181,25 +211,36 @@ def truncate(
         max_duration: float,
         offset_type: str,
         keep_overflowing_supervisions: bool,
-        random_seed: int
+        random_seed: int,
+        num_jobs: int
 ):
     """
     Truncate the cuts in the CUT_MANIFEST and write them to OUTPUT_CUT_MANIFEST.
     Cuts shorter than MAX_DURATION will not be modified.
     """
-    fix_random_seed(random_seed)
-    cut_set = CutSet.from_yaml(cut_manifest)
-    truncated_cut_set = cut_set.truncate(
+    do_work = partial(
+        _truncate_chunk,
         max_duration=max_duration,
         offset_type=offset_type,
         keep_excessive_supervisions=keep_overflowing_supervisions,
         preserve_id=preserve_id
     )
-    truncated_cut_set.to_yaml(output_cut_manifest)
+    chunks = partition_all(TRUNCATE_CHUNK_SIZE, CutSet.iter_from_file(cut_manifest))
+    # Every chunk of cuts gets its own seed, so that the output doesn't depend on the number of jobs.
+    seeds = count(random_seed)
+    if num_jobs == 1:
+        # Avoid spawning subprocesses for single threaded processing
+        CutSet.write_streaming(output_cut_manifest, chain.from_iterable(map(do_work, chunks, seeds)))
+    else:
+        with ProcessPoolExecutor(num_jobs) as ex:
+            CutSet.write_streaming(
+                output_cut_manifest,
+                chain.from_iterable(_bounded_map(ex, do_work, chunks, seeds, max_in_flight=2 * num_jobs))
+            )
 
 
 @cut.command()
-@click.argument('cut_manifests', nargs=-1, type=click.Path(exists=True, dir_okay=False))
+@click.argument('cut_manifests', nargs=-1)
 @click.argument('output_cut_manifest', type=click.Path())
 def append(
         cut_manifests: List[Pathlike],
@@ -212,6 +253,74 @@ def append(
     input argument list.
     If CUT_MANIFESTS have different lengths, the script stops once the shortest CutSet is depleted.
     """
-    cut_sets = [CutSet.from_yaml(path) for path in cut_manifests]
-    appended_cut_set = CutSet.from_cuts(append_cuts(cuts) for cuts in zip(*cut_sets))
-    appended_cut_set.to_yaml(output_cut_manifest)
+    _check_files_exist(cut_manifests, param_hint='CUT_MANIFESTS')
+    CutSet.write_streaming(output_cut_manifest, (append_cuts(cuts) for cuts in _joint_iter(cut_manifests)))
+
+
+def _check_files_exist(paths: Sequence[Pathlike], param_hint: str):
+    """
+    Check that all the `paths` point to existing files, querying the filesystem concurrently.
+    We use it instead of `click.Path(exists=True)` for variadic arguments, as click checks the paths one by one,
+    which adds up for many manifests on a filesystem with high metadata latency (e.g. NFS).
+    """
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        missing = [str(path) for path, exists in zip(paths, ex.map(os.path.isfile, paths)) if not exists]
+    if missing:
+        raise click.BadParameter(f'No such file(s): {", ".join(missing)}', param_hint=param_hint)
+
+
+def _truncate_chunk(
+        cuts: Sequence[AnyCut],
+        random_seed: int,
+        max_duration: Seconds,
+        offset_type: str,
+        keep_excessive_supervisions: bool,
+        preserve_id: bool
+) -> List[AnyCut]:
+    rng = random.Random(random_seed)
+    return [
+        truncate_cut(
+            cut,
+            max_duration=max_duration,
+            offset_type=offset_type,
+            keep_excessive_supervisions=keep_excessive_supervisions,
+            preserve_id=preserve_id,
+            rng=rng
+        )
+        for cut in cuts
+    ]
+
+
+def _bounded_map(
+        ex: Executor,
+        fn: Callable,
+        *iterables: Iterable,
+        max_in_flight: int
+) -> Generator[Any, None, None]:
+    """
+    Like `ex.map(fn, *iterables)`, but submits at most `max_in_flight` tasks ahead of the yielded results,
+    so that the inputs are consumed lazily instead of being read (and pickled) all at once.
+    The results are yielded in the order of the inputs.
+    """
+    futures = deque()
+    for args in zip(*iterables):
+        futures.append(ex.submit(fn, *args))
+        if len(futures) >= max_in_flight:
+            yield futures.popleft().result()
+    while futures:
+        yield futures.popleft().result()
+
+
+def _joint_iter(paths: Sequence[Pathlike]) -> Generator[Tuple[AnyCut, ...], None, None]:
+    """
+    Iterate jointly over the cuts read lazily from the manifests in `paths`, yielding the tuples of cuts
+    on the same positions, until the shortest manifest is depleted. When one of the manifests is empty,
+    the manifests after it are not read at all.
+    All the manifests are closed as soon as the iteration ends, rather than when they are garbage collected.
+    """
+    cut_iters = [CutSet.iter_from_file(path) for path in paths]
+    try:
+        yield from zip(*cut_iters)
+    finally:
+        for cut_iter in cut_iters:
+            cut_iter.close()
@@ -19,12 +19,14 @@ __all__ = ['librimix']
     '--with-precomputed-mixtures/--no-precomputed-mixtures', type=bool, default=False,
     help='Optionally create an RecordingSet manifest including the precomputed LibriMix mixtures.'
 )
+@click.option('-j', '--num-jobs', type=int, default=1, help='Number of parallel processes.')
 def librimix(
         librimix_csv: Pathlike,
         output_dir: Pathlike,
         sampling_rate: int,
         min_segment_seconds: float,
-        with_precomputed_mixtures: bool
+        with_precomputed_mixtures: bool,
+        num_jobs: int
 ):
     """Recipe to prepare the manifests for LibrMix source separation task."""
     prepare_librimix(
@@ -32,5 +34,6 @@ def librimix(
         output_dir=output_dir,
         sampling_rate=sampling_rate,
         min_segment_seconds=min_segment_seconds,
-        with_precomputed_mixtures=with_precomputed_mixtures
+        with_precomputed_mixtures=with_precomputed_mixtures,
+        num_jobs=num_jobs
     )
@@ -1,25 +1,31 @@
+import os
 import random
 from dataclasses import dataclass
 from functools import reduce
+from itertools import count
 from math import ceil, floor
-from typing import Dict, List, Optional, Iterable, Union
+from typing import Dict, List, Optional, Iterable, Union, Generator, Tuple
 from uuid import uuid4
 
 import numpy as np
 
+from lhotse._cut_kernels import get_truncate_tracks
 from lhotse.audio import RecordingSet
 from lhotse.features import Features, FeatureSet, FbankMixer
 from lhotse.supervision import SupervisionSegment, SupervisionSet
 from lhotse.utils import (
     Seconds,
     Decibels,
-    overlaps,
-    TimeSpan,
-    overspans,
     Pathlike,
     asdict_nonull,
     load_yaml,
-    save_to_yaml
+    save_to_yaml,
+    save_to_yaml_streaming,
+    extension_contains,
+    load_json,
+    save_to_json,
+    load_jsonl,
+    save_to_jsonl
 )
 
 # One of the design principles for Cuts is a maximally "lazy" implementation, e.g. when overlaying/mixing Cuts,
@@ -31,6 +37,34 @@ from lhotse.utils import (
 # The class names are strings here so that the Python interpreter resolves them after parsing the whole file.
 AnyCut = Union['Cut', 'MixedCut']
 
+# Generating a UUID for every new Cut is expensive when creating millions of them (e.g. in CutSet.truncate).
+# Instead, we draw a random prefix once per process (so that the IDs don't clash between different runs
+# or worker processes) and follow it with a counter.
+_CUT_ID_PREFIX = uuid4().hex
+_CUT_ID_COUNTER = count()
+
+
+def _reset_cut_id_prefix():
+    global _CUT_ID_PREFIX
+    _CUT_ID_PREFIX = uuid4().hex
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_cut_id_prefix)
+
+
+def _new_id() -> str:
+    return f'{_CUT_ID_PREFIX}-{next(_CUT_ID_COUNTER):x}'
+
+
+# MixedCut.truncate uses a compiled kernel (when numba is available) for mixes with at least that many tracks;
+# for fewer tracks, the overhead of building the arrays outweighs the gains.
+_TRUNCATE_KERNEL_MIN_TRACKS = 32
+
+# Cut.truncate filters the supervisions with vectorized numpy operations for cuts with at least that many
+# supervisions; for fewer supervisions, a plain loop is faster.
+_VECTORIZED_SUPERVISIONS_MIN_COUNT = 32
+
 
 @dataclass
 class Cut:
@@ -38,6 +72,8 @@ class Cut:
     A Cut is a single "segment" that we'll train on. It contains the features corresponding to
     a piece of a recording, with zero or more SupervisionSegments.
     """
+    __slots__ = ('id', 'start', 'duration', 'features', 'supervisions', '_supervision_bounds', '_num_frames')
+
     id: str
 
     # Begin and duration are needed to specify which chunk of features to load.
@@ -53,6 +89,12 @@ class Cut:
     # cut duration. They also might overlap.
     supervisions: List[SupervisionSegment]
 
+    def __post_init__(self):
+        # The (start, end) arrays of the supervisions, built lazily by truncate() for cuts with many supervisions.
+        self._supervision_bounds = None
+        # Computed on the first access; Cut operations never modify a Cut in place, so it remains valid.
+        self._num_frames = None
+
     @property
     def channel(self) -> int:
         return self.features.channel_id
@@ -67,7 +109,9 @@ class Cut:
 
     @property
     def num_frames(self) -> int:
-        return round(self.duration / self.features.frame_shift)
+        if self._num_frames is None:
+            self._num_frames = round(self.duration / self.features.frame_shift)
+        return self._num_frames
 
     @property
     def num_features(self) -> int:
@@ -120,7 +164,8 @@ class Cut:
             By default, the duration is (end of the cut before truncation) - (offset).
         :param keep_excessive_supervisions: bool. Since trimming may happen inside a SupervisionSegment,
             the caller has an option to either keep or discard such supervisions.
-        :param preserve_id: bool. Should the truncated cut keep the same ID or get a new, random one.
+        :param preserve_id: bool. Should the truncated cut keep the same ID or get a new, unique one
+            (a random per-process prefix followed by a counter).
         :return: a new Cut instance.
         """
         new_start = self.start + offset
@@ -128,18 +173,64 @@ class Cut:
         new_duration = self.duration - new_start if duration is None else until - offset
         assert new_duration > 0.0
         assert new_start + new_duration <= self.start + self.duration + 1e-5
-        new_time_span = TimeSpan(start=new_start, end=new_start + new_duration)
-        criterion = overlaps if keep_excessive_supervisions else overspans
+        return self._truncate_unchecked(
+            new_start=new_start,
+            new_duration=new_duration,
+            keep_excessive_supervisions=keep_excessive_supervisions,
+            preserve_id=preserve_id
+        )
+
+    def _truncate_unchecked(
+            self,
+            new_start: Seconds,
+            new_duration: Seconds,
+            keep_excessive_supervisions: bool = True,
+            preserve_id: bool = False
+    ) -> 'Cut':
+        """
+        Create the truncated Cut from its new start and duration, without checking that they are valid.
+        Used directly by the callers that already know the truncated region lies within the Cut (e.g. `truncate_cut`).
+        """
+        if self.supervisions:
+            supervisions = self._supervisions_within(new_start, new_start + new_duration, keep_excessive_supervisions)
+        else:
+            supervisions = []
         return Cut(
-            id=self.id if preserve_id else str(uuid4()),
+            id=self.id if preserve_id else _new_id(),
             start=new_start,
             duration=new_duration,
-            supervisions=[
-                segment for segment in self.supervisions if criterion(new_time_span, segment)
-            ],
+            supervisions=supervisions,
             features=self.features
         )
 
+    def _supervisions_within(
+            self,
+            start: Seconds,
+            end: Seconds,
+            keep_excessive_supervisions: bool = True
+    ) -> List[SupervisionSegment]:
+        """
+        Return the supervisions that overlap with the time span [start, end] (or, when `keep_excessive_supervisions`
+        is False, the ones that are fully covered by it), in their original order.
+        For cuts with many supervisions, the check is vectorized over the arrays of supervision boundaries,
+        which are computed once per cut and re-used by the subsequent truncations.
+        """
+        if len(self.supervisions) < _VECTORIZED_SUPERVISIONS_MIN_COUNT:
+            # The same checks as in `overlaps` and `overspans`, inlined to avoid a function call per segment.
+            if keep_excessive_supervisions:
+                return [s for s in self.supervisions if s.start < end and start < s.end]
+            return [s for s in self.supervisions if start <= s.start <= s.end <= end]
+        if self._supervision_bounds is None:
+            starts = np.fromiter((s.start for s in self.supervisions), dtype=np.float64, count=len(self.supervisions))
+            ends = np.fromiter((s.end for s in self.supervisions), dtype=np.float64, count=len(self.supervisions))
+            self._supervision_bounds = starts, ends
+        starts, ends = self._supervision_bounds
+        if keep_excessive_supervisions:
+            mask = (starts < end) & (start < ends)
+        else:
+            mask = (start <= starts) & (starts <= ends) & (ends <= end)
+        return [self.supervisions[idx] for idx in np.flatnonzero(mask).tolist()]
+
     def overlay(self, other: AnyCut, offset_other_by: Seconds = 0.0, snr: Optional[Decibels] = None) -> 'MixedCut':
         """
         Overlay, or mix, this Cut with the `other` Cut. Optionally the `other` Cut may be shifted by `offset_other_by`
@@ -156,7 +247,7 @@ class Cut:
             else other.tracks
         )
         return MixedCut(
-            id=str(uuid4()),
+            id=_new_id(),
             tracks=[MixTrack(cut=self)] + new_tracks
         )
 
@@ -177,7 +268,7 @@ class Cut:
         return Cut(
             **data,
             features=Features.from_dict(feature_info),
-            supervisions=[SupervisionSegment.from_dict(s) for s in supervision_infos]
+            supervisions=list(map(SupervisionSegment.from_dict, supervision_infos))
         )
 
 
@@ -206,9 +297,39 @@ class MixedCut:
     as it only holds their IDs ("pointers").
     The SNR and offset of all the tracks are specified relative to the first track.
     """
+    __slots__ = ('id', 'tracks', '_sorted_tracks', '_sorted_track_arrays', '_duration', '_num_frames')
+
     id: str
     tracks: List[MixTrack]
 
+    def __post_init__(self):
+        # Lazily computed on the first access; they remain valid, as MixedCut operations never modify the tracks
+        # in place (overlay/append/truncate create a new MixedCut).
+        self._sorted_tracks = None
+        self._sorted_track_arrays = None
+        self._duration = None
+        self._num_frames = None
+
+    @property
+    def sorted_tracks(self) -> List[MixTrack]:
+        """The tracks sorted by their offsets in the mix."""
+        if self._sorted_tracks is None:
+            self._sorted_tracks = sorted(self.tracks, key=lambda t: t.offset)
+        return self._sorted_tracks
+
+    def _get_sorted_track_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the arrays of track offsets and track cut durations, in the order of `sorted_tracks`.
+        They are used by the vectorized computations in `truncate`.
+        """
+        if self._sorted_track_arrays is None:
+            tracks = self.sorted_tracks
+            self._sorted_track_arrays = (
+                np.fromiter((track.offset for track in tracks), dtype=np.float64, count=len(tracks)),
+                np.fromiter((track.cut.duration for track in tracks), dtype=np.float64, count=len(tracks))
+            )
+        return self._sorted_track_arrays
+
     @property
     def supervisions(self) -> List[SupervisionSegment]:
         """
@@ -223,12 +344,15 @@ class MixedCut:
 
     @property
     def duration(self) -> Seconds:
-        track_durations = (track.offset + track.cut.duration for track in self.tracks)
-        return max(track_durations)
+        if self._duration is None:
+            self._duration = max(track.offset + track.cut.duration for track in self.tracks)
+        return self._duration
 
     @property
     def num_frames(self) -> int:
-        return round(self.duration / self.tracks[0].cut.features.frame_shift)
+        if self._num_frames is None:
+            self._num_frames = round(self.duration / self.tracks[0].cut.features.frame_shift)
+        return self._num_frames
 
     @property
     def num_features(self) -> int:
@@ -255,7 +379,7 @@ class MixedCut:
             else other.tracks
         )
         return MixedCut(
-            id=str(uuid4()),
+            id=_new_id(),
             tracks=self.tracks + new_tracks
         )
 
@@ -289,57 +413,86 @@ class MixedCut:
             By default, the duration is (end of the cut before truncation) - (offset).
         :param keep_excessive_supervisions: bool. Since trimming may happen inside a SupervisionSegment, the caller has
             an option to either keep or discard such supervisions.
-        :param preserve_id: bool. Should the truncated cut keep the same ID or get a new, random one.
+        :param preserve_id: bool. Should the truncated cut keep the same ID or get a new, unique one
+            (a random per-process prefix followed by a counter).
         :return: a new MixedCut instance.
         """
 
-        new_tracks = []
         old_duration = self.duration
         new_mix_end = old_duration - offset if duration is None else offset + duration
-
-        for track in sorted(self.tracks, key=lambda t: t.offset):
-            # First, determine how much of the beginning of the current track we're going to truncate:
-            # when the track offset is larger than the truncation offset, we are not truncating the cut;
-            # just decreasing the track offset.
-
-            # 'cut_offset' determines how much we're going to truncate the Cut for the current track.
-            cut_offset = max(offset - track.offset, 0)
-            # 'track_offset' determines the new track's offset after truncation.
-            track_offset = max(track.offset - offset, 0)
-            # 'track_end' is expressed relative to the beginning of the mix
-            # (not to be confused with the 'start' of the underlying Cut)
-            track_end = track.offset + track.cut.duration
-
-            if track_end < offset:
-                # Omit a Cut that ends before the truncation offset.
-                continue
-
-            cut_duration_decrease = 0
-            if track_end > new_mix_end:
-                if duration is not None:
-                    cut_duration_decrease = track_end - new_mix_end
-                else:
-                    cut_duration_decrease = track_end - old_duration
-
-            # Compute the new Cut's duration after trimming the start and the end.
-            new_duration = track.cut.duration - cut_offset - cut_duration_decrease
-            if new_duration <= 0:
-                # Omit a Cut that is completely outside the time span of the new truncated MixedCut.
-                continue
-
-            new_tracks.append(
-                MixTrack(
-                    cut=track.cut.truncate(
-                        offset=cut_offset,
-                        duration=new_duration,
-                        keep_excessive_supervisions=keep_excessive_supervisions,
-                        preserve_id=preserve_id
-                    ),
-                    offset=track_offset,
-                    snr=track.snr
+        tracks = self.sorted_tracks
+
+        truncate_tracks = get_truncate_tracks() if len(tracks) >= _TRUNCATE_KERNEL_MIN_TRACKS else None
+        if truncate_tracks is not None:
+            # For mixes with many tracks, the arithmetic is done in a compiled kernel.
+            track_offsets, track_durations = self._get_sorted_track_arrays()
+            keep_mask, cut_offsets, new_durations, track_offsets = truncate_tracks(
+                track_offsets,
+                track_durations,
+                offset,
+                new_mix_end,
+                old_duration,
+                duration is not None
+            )
+            truncated_tracks = [
+                (track, cut_offset, new_duration, track_offset)
+                for track, keep, cut_offset, new_duration, track_offset in zip(
+                    tracks,
+                    keep_mask.tolist(),
+                    cut_offsets.tolist(),
+                    new_durations.tolist(),
+                    track_offsets.tolist()
                 )
+                if keep
+            ]
+        else:
+            truncated_tracks = []
+            for track in tracks:
+                # First, determine how much of the beginning of the current track we're going to truncate:
+                # when the track offset is larger than the truncation offset, we are not truncating the cut;
+                # just decreasing the track offset.
+
+                # 'cut_offset' determines how much we're going to truncate the Cut for the current track.
+                cut_offset = max(offset - track.offset, 0)
+                # 'track_offset' determines the new track's offset after truncation.
+                track_offset = max(track.offset - offset, 0)
+                # 'track_end' is expressed relative to the beginning of the mix
+                # (not to be confused with the 'start' of the underlying Cut)
+                track_end = track.offset + track.cut.duration
+
+                if track_end < offset:
+                    # Omit a Cut that ends before the truncation offset.
+                    continue
+
+                cut_duration_decrease = 0
+                if track_end > new_mix_end:
+                    if duration is not None:
+                        cut_duration_decrease = track_end - new_mix_end
+                    else:
+                        cut_duration_decrease = track_end - old_duration
+
+                # Compute the new Cut's duration after trimming the start and the end.
+                new_duration = track.cut.duration - cut_offset - cut_duration_decrease
+                if new_duration <= 0:
+                    # Omit a Cut that is completely outside the time span of the new truncated MixedCut.
+                    continue
+
+                truncated_tracks.append((track, cut_offset, new_duration, track_offset))
+
+        new_tracks = [
+            MixTrack(
+                cut=track.cut.truncate(
+                    offset=cut_offset,
+                    duration=new_duration,
+                    keep_excessive_supervisions=keep_excessive_supervisions,
+                    preserve_id=preserve_id
+                ),
+                offset=track_offset,
+                snr=track.snr
             )
-        return MixedCut(id=str(uuid4()), tracks=new_tracks)
+            for track, cut_offset, new_duration, track_offset in truncated_tracks
+        ]
+        return MixedCut(id=_new_id(), tracks=new_tracks)
 
     def load_features(self, root_dir: Optional[Pathlike] = None) -> np.ndarray:
         """Loads the features of the source cuts and overlays them on-the-fly."""
@@ -361,7 +514,7 @@ class MixedCut:
 
     @staticmethod
     def from_dict(data: dict) -> 'MixedCut':
-        return MixedCut(id=data['id'], tracks=[MixTrack.from_dict(track) for track in data['tracks']])
+        return MixedCut(id=data['id'], tracks=list(map(MixTrack.from_dict, data['tracks'])))
 
 
 @dataclass
@@ -371,6 +524,8 @@ class CutSet:
     It may have wider span than the actual supervisions, provided the features for the whole span exist.
     It is the basic building block of PyTorch-style Datasets for speech/audio processing tasks.
     """
+    __slots__ = ('cuts',)
+
     cuts: Dict[str, AnyCut]
 
     @property
@@ -385,30 +540,92 @@ class CutSet:
     def from_cuts(cuts: Iterable[AnyCut]) -> 'CutSet':
         return CutSet({cut.id: cut for cut in cuts})
 
+    @staticmethod
+    def from_file(path: Pathlike) -> 'CutSet':
+        """
+        Read a CutSet from a JSON Lines (.jsonl, .jsonl.gz), a JSON (.json, .json.gz) or a YAML manifest,
+        depending on the extension.
+        """
+        if extension_contains('.jsonl', path):
+            return CutSet.from_jsonl(path)
+        if extension_contains('.json', path):
+            return CutSet.from_json(path)
+        return CutSet.from_yaml(path)
+
+    @staticmethod
+    def iter_from_file(path: Pathlike) -> Generator[AnyCut, None, None]:
+        """
+        Lazily iterate over the cuts stored in a manifest, without holding all of them in a CutSet.
+        JSON Lines manifests are read one line at a time; JSON and YAML manifests have to be parsed as a whole,
+        but the cuts are still deserialized one at a time, when requested.
+        """
+        if extension_contains('.jsonl', path):
+            raw_cuts = load_jsonl(path)
+        elif extension_contains('.json', path):
+            raw_cuts = load_json(path)
+        else:
+            raw_cuts = load_yaml(path)
+        for raw_cut in raw_cuts:
+            yield deserialize_cut(raw_cut)
+
     @staticmethod
     def from_yaml(path: Pathlike) -> 'CutSet':
         raw_cuts = load_yaml(path)
+        return CutSet.from_cuts(deserialize_cut(cut) for cut in raw_cuts)
 
-        def deserialize_one(raw_cut: dict) -> AnyCut:
-            cut_type = raw_cut.pop('type')
-            if cut_type == 'Cut':
-                return Cut.from_dict(raw_cut)
-            if cut_type == 'MixedCut':
-                return MixedCut.from_dict(raw_cut)
-            raise ValueError(f"Unexpected cut type during deserialization: '{cut_type}'")
+    @staticmethod
+    def from_json(path: Pathlike) -> 'CutSet':
+        return CutSet.from_cuts(deserialize_cut(cut) for cut in load_json(path))
 
-        return CutSet.from_cuts(deserialize_one(cut) for cut in raw_cuts)
+    @staticmethod
+    def from_jsonl(path: Pathlike) -> 'CutSet':
+        return CutSet.from_cuts(deserialize_cut(cut) for cut in load_jsonl(path))
+
+    def to_file(self, path: Pathlike):
+        """
+        Write the CutSet as a JSON Lines (.jsonl, .jsonl.gz), a JSON (.json, .json.gz) or a YAML manifest,
+        depending on the extension.
+        """
+        if extension_contains('.jsonl', path):
+            self.to_jsonl(path)
+        elif extension_contains('.json', path):
+            self.to_json(path)
+        else:
+            self.to_yaml(path)
+
+    @staticmethod
+    def write_streaming(path: Pathlike, cuts: Iterable[AnyCut]):
+        """
+        Write the cuts to a JSON Lines (.jsonl, .jsonl.gz), a JSON (.json, .json.gz) or a YAML manifest,
+        depending on the extension, as soon as they are produced by the `cuts` iterable,
+        without collecting them in a CutSet first.
+        Note: a JSON document can only be written as a whole, so in that case the cuts are collected anyway.
+        """
+        data = (serialize_cut(cut) for cut in cuts)
+        if extension_contains('.jsonl', path):
+            save_to_jsonl(data, path)
+        elif extension_contains('.json', path):
+            save_to_json(list(data), path)
+        else:
+            save_to_yaml_streaming(data, path)
 
     def to_yaml(self, path: Pathlike):
-        data = [{**asdict_nonull(cut), 'type': type(cut).__name__} for cut in self]
+        data = [serialize_cut(cut) for cut in self]
         save_to_yaml(data, path)
 
+    def to_json(self, path: Pathlike):
+        save_to_json([serialize_cut(cut) for cut in self], path)
+
+    def to_jsonl(self, path: Pathlike):
+        save_to_jsonl((serialize_cut(cut) for cut in self), path)
+
     def truncate(
             self,
             max_duration: Seconds,
             offset_type: str,
             keep_excessive_supervisions: bool = True,
-            preserve_id: bool = False
+            preserve_id: bool = False,
+            rng: Optional[random.Random] = None
     ) -> 'CutSet':
         """
         Return a new CutSet with the Cuts truncated so that their durations are at most `max_duration`.
@@ -420,32 +637,23 @@ class CutSet:
             - 'random' => cuts are truncated randomly between their start and their end minus max_duration
         :param keep_excessive_supervisions: bool. When a cut is truncated in the middle of a supervision segment,
             should the supervision be kept.
-        :param preserve_id: bool. Should the truncated cut keep the same ID or get a new, random one.
+        :param preserve_id: bool. Should the truncated cut keep the same ID or get a new, unique one
+            (a random per-process prefix followed by a counter).
+        :param rng: optional random.Random instance used to draw the offsets for `offset_type='random'`.
+            By default, the global `random` module is used.
         :return: a new CutSet instance with truncated cuts.
         """
-        truncated_cuts = []
-        for cut in self:
-            if cut.duration <= max_duration:
-                truncated_cuts.append(cut)
-                continue
-
-            def compute_offset():
-                if offset_type == 'start':
-                    return 0.0
-                last_offset = cut.duration - max_duration
-                if offset_type == 'end':
-                    return last_offset
-                if offset_type == 'random':
-                    return random.uniform(0.0, last_offset)
-                raise ValueError(f"Unknown 'offset_type' option: {offset_type}")
-
-            truncated_cuts.append(cut.truncate(
-                offset=compute_offset(),
-                duration=max_duration,
+        return CutSet.from_cuts(
+            truncate_cut(
+                cut,
+                max_duration=max_duration,
+                offset_type=offset_type,
                 keep_excessive_supervisions=keep_excessive_supervisions,
-                preserve_id=preserve_id
-            ))
-        return CutSet.from_cuts(truncated_cuts)
+                preserve_id=preserve_id,
+                rng=rng
+            )
+            for cut in self
+        )
 
     def __contains__(self, item: Union[str, Cut, MixedCut]) -> bool:
         if isinstance(item, str):
@@ -467,13 +675,75 @@ class CutSet:
         return CutSet(cuts={**self.cuts, **other.cuts})
 
 
+def truncate_cut(
+        cut: AnyCut,
+        max_duration: Seconds,
+        offset_type: str,
+        keep_excessive_supervisions: bool = True,
+        preserve_id: bool = False,
+        rng: Optional[random.Random] = None
+) -> AnyCut:
+    """
+    Truncate a single cut so that its duration is at most `max_duration`; see `CutSet.truncate` for the description
+    of the arguments. A cut shorter than `max_duration` is returned as-is.
+    :param rng: optional random.Random instance used to draw the offsets for `offset_type='random'`.
+        By default, the global `random` module is used.
+    :return: a new cut instance, or the input cut when it did not need truncation.
+    """
+    if cut.duration <= max_duration:
+        return cut
+
+    if offset_type == 'start':
+        offset = 0.0
+    else:
+        last_offset = cut.duration - max_duration
+        if offset_type == 'end':
+            offset = last_offset
+        elif offset_type == 'random':
+            offset = (rng if rng is not None else random).uniform(0.0, last_offset)
+        else:
+            raise ValueError(f"Unknown 'offset_type' option: {offset_type}")
+
+    if isinstance(cut, Cut):
+        # The truncated region is known to lie within the cut, so we skip the checks done in Cut.truncate().
+        # The duration is computed the same way as there, to get identical results.
+        return cut._truncate_unchecked(
+            new_start=cut.start + offset,
+            new_duration=(offset + max_duration) - offset,
+            keep_excessive_supervisions=keep_excessive_supervisions,
+            preserve_id=preserve_id
+        )
+
+    return cut.truncate(
+        offset=offset,
+        duration=max_duration,
+        keep_excessive_supervisions=keep_excessive_supervisions,
+        preserve_id=preserve_id
+    )
+
+
+def serialize_cut(cut: AnyCut) -> dict:
+    """Convert a Cut or a MixedCut into a dict of primitives, tagged with the cut type."""
+    return {**asdict_nonull(cut), 'type': type(cut).__name__}
+
+
+def deserialize_cut(raw_cut: dict) -> AnyCut:
+    """Re-create a Cut or a MixedCut from a dict produced by `serialize_cut`."""
+    cut_type = raw_cut.pop('type')
+    if cut_type == 'Cut':
+        return Cut.from_dict(raw_cut)
+    if cut_type == 'MixedCut':
+        return MixedCut.from_dict(raw_cut)
+    raise ValueError(f"Unexpected cut type during deserialization: '{cut_type}'")
+
+
 def make_cuts_from_features(feature_set: FeatureSet) -> CutSet:
     """
     Utility that converts a FeatureSet to a CutSet without any adjustment of the segment boundaries.
     """
     return CutSet.from_cuts(
         Cut(
-            id=str(uuid4()),
+            id=_new_id(),
             start=features.start,
             duration=features.duration,
             features=features,
@@ -513,18 +783,18 @@ def make_windowed_cuts_from_features(
         n_cuts = round_fn(features.duration / cut_shift)
         if (n_cuts - 1) * cut_shift + cut_duration > features.duration and not keep_shorter_windows:
             n_cuts -= 1
-        for idx in range(n_cuts):
-            offset = features.start + idx * cut_shift
-            duration = min(cut_duration, features.end - offset)
-            cuts.append(
-                Cut(
-                    id=str(uuid4()),
-                    start=offset,
-                    duration=duration,
-                    features=features,
-                    supervisions=[]
-                )
+        offsets = features.start + np.arange(max(n_cuts, 0), dtype=np.float64) * cut_shift
+        durations = np.minimum(cut_duration, features.end - offsets)
+        cuts.extend(
+            Cut(
+                id=_new_id(),
+                start=offset,
+                duration=duration,
+                features=features,
+                supervisions=[]
             )
+            for offset, duration in zip(offsets.tolist(), durations.tolist())
+        )
     return CutSet.from_cuts(cuts)
 
 
@@ -535,7 +805,7 @@ def make_cuts_from_supervisions(supervision_set: SupervisionSet, feature_set: Fe
     """
     return CutSet.from_cuts(
         Cut(
-            id=str(uuid4()),
+            id=_new_id(),
             start=supervision.start,
             duration=supervision.duration,
             features=feature_set.find(
@@ -571,13 +841,43 @@ def append(
 
 def mix_cuts(cuts: Iterable[AnyCut]) -> MixedCut:
     """Return a MixedCut that consists of the input Cuts overlayed on each other as-is."""
-    # The following is a fold (accumulate/aggregate) operation; it starts with cuts[0], and overlays it with cuts[1];
-    #  then takes their mix and overlays it with cuts[2]; and so on.
-    return reduce(mix, cuts)
+    # The result is the same as that of a fold (accumulate/aggregate) operation, which starts with cuts[0],
+    # and overlays it with cuts[1]; then takes their mix and overlays it with cuts[2]; and so on.
+    # We build all the tracks in a single pass instead, to avoid creating the intermediate MixedCuts.
+    cuts = list(cuts)
+    if len(cuts) < 2:
+        return reduce(mix, cuts)
+    _check_num_features(cuts)
+    return MixedCut(id=_new_id(), tracks=[track for cut in cuts for track in _as_tracks(cut)])
 
 
 def append_cuts(cuts: Iterable[AnyCut]) -> AnyCut:
     """Return a MixedCut that consists of the input Cuts appended to each other as-is."""
-    # The following is a fold (accumulate/aggregate) operation; it starts with cuts[0], and appends cuts[1] to it;
-    #  then takes their it concatenation and appends cuts[2] to it; and so on.
-    return reduce(append, cuts)
+    # The result is the same as that of a fold (accumulate/aggregate) operation, which starts with cuts[0],
+    # and appends cuts[1] to it; then takes their concatenation and appends cuts[2] to it; and so on.
+    # We build all the tracks in a single pass instead, to avoid creating the intermediate MixedCuts.
+    cuts = list(cuts)
+    if len(cuts) < 2:
+        return reduce(append, cuts)
+    _check_num_features(cuts)
+    tracks = list(_as_tracks(cuts[0]))
+    duration = cuts[0].duration
+    for cut in cuts[1:]:
+        if isinstance(cut, Cut):
+            tracks.append(MixTrack(cut=cut, offset=duration))
+            duration = duration + cut.duration
+        else:
+            # Consistently with MixedCut.overlay, the tracks of a MixedCut are added with their original offsets.
+            tracks.extend(cut.tracks)
+            duration = max(duration, cut.duration)
+    return MixedCut(id=_new_id(), tracks=tracks)
+
+
+def _as_tracks(cut: AnyCut) -> List[MixTrack]:
+    return [MixTrack(cut=cut)] if isinstance(cut, Cut) else cut.tracks
+
+
+def _check_num_features(cuts: List[AnyCut]):
+    num_features = cuts[0].num_features
+    assert all(cut.num_features == num_features for cut in cuts), \
+        "Cannot overlay cuts with different feature dimensions."
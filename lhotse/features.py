@@ -18,7 +18,16 @@ import yaml
 
 from lhotse.audio import Recording
 from lhotse.supervision import SupervisionSegment
-from lhotse.utils import Seconds, Pathlike, Decibels, load_yaml, save_to_yaml
+from lhotse.utils import (
+    Seconds,
+    Pathlike,
+    Decibels,
+    load_yaml,
+    save_to_yaml,
+    extension_contains,
+    load_json,
+    save_to_json
+)
 
 
 @dataclass
@@ -138,6 +147,11 @@ class Features:
     it supports numpy arrays serialized with np.save, as well as arrays compressed with lilcom;
     storage_path is the path to the file on the local filesystem.
     """
+    __slots__ = (
+        'recording_id', 'channel_id', 'start', 'duration', 'type', 'num_frames', 'num_features', 'storage_type',
+        'storage_path'
+    )
+
     recording_id: str
     channel_id: int
     start: Seconds
@@ -212,17 +226,49 @@ class FeatureSet:
     def __post_init__(self):
         self.features = sorted(self.features)
 
+    @staticmethod
+    def from_file(path: Pathlike) -> 'FeatureSet':
+        """
+        Read a FeatureSet from a JSON (.json, .json.gz) or a YAML manifest, depending on the extension.
+        A FeatureSet is a single mapping rather than a list of items, so JSON Lines (.jsonl) is not supported.
+        """
+        _check_not_jsonl(path)
+        if extension_contains('.json', path):
+            return FeatureSet.from_json(path)
+        return FeatureSet.from_yaml(path)
+
     @staticmethod
     def from_yaml(path: Pathlike) -> 'FeatureSet':
-        data = load_yaml(path)
+        return FeatureSet.from_dict(load_yaml(path))
+
+    @staticmethod
+    def from_json(path: Pathlike) -> 'FeatureSet':
+        return FeatureSet.from_dict(load_json(path))
+
+    @staticmethod
+    def from_dict(data: dict) -> 'FeatureSet':
         return FeatureSet(
             feature_extractor=FeatureExtractor.from_dict(data['feature_extractor']),
             features=[Features(**feature_data) for feature_data in data['features']],
         )
 
+    def to_file(self, path: Pathlike):
+        """
+        Write the FeatureSet as a JSON (.json, .json.gz) or a YAML manifest, depending on the extension.
+        A FeatureSet is a single mapping rather than a list of items, so JSON Lines (.jsonl) is not supported.
+        """
+        _check_not_jsonl(path)
+        if extension_contains('.json', path):
+            self.to_json(path)
+        else:
+            self.to_yaml(path)
+
     def to_yaml(self, path: Pathlike):
         save_to_yaml(asdict(self), path)
 
+    def to_json(self, path: Pathlike):
+        save_to_json(asdict(self), path)
+
     def find(
             self,
             recording_id: str,
@@ -423,17 +469,22 @@ class FbankMixer:
         :param frame_length: Required to correctly compute offset and padding during the mix.
         :param log_energy_floor: The value used to pad the shorter features during the mix.
         """
-        # The mixing output will be available in self.mixed_feats
-        self.mixed_feats = base_feats
+        # The mix is accumulated in the linear energy domain in a single float64 buffer, which is only re-allocated
+        # when an incoming track extends past its end; the mixing output is available in self.mixed_feats.
+        self._energies = np.exp(base_feats, dtype=np.float64)
         # Keep a pre-computed energy value of the features that we initialize the Mixer with;
         # it is required to compute gain ratios that satisfy SNR during the mix.
-        self.reference_energy = fbank_energy(base_feats)
+        self.reference_energy = float(np.sum(self._energies))
         self.frame_shift = frame_shift
         self.log_energy_floor = log_energy_floor
 
     @property
     def num_features(self):
-        return self.mixed_feats.shape[1]
+        return self._energies.shape[1]
+
+    @property
+    def mixed_feats(self) -> np.ndarray:
+        return np.log(self._energies)
 
     def add_to_mix(
             self,
@@ -453,37 +504,20 @@ class FbankMixer:
         assert offset >= 0.0, "Negative offset in mixing is not supported."
 
         num_frames_offset = round(offset / self.frame_shift)
-        current_num_frames = self.mixed_feats.shape[0]
+        current_num_frames = self._energies.shape[0]
         incoming_num_frames = feats.shape[0] + num_frames_offset
         mix_num_frames = max(current_num_frames, incoming_num_frames)
-
-        existing_feats = self.mixed_feats
-        feats_to_add = feats
+        floor_energy = np.exp(self.log_energy_floor)
 
         # When the existing frames are less than what we anticipate after the mix,
         # we need to pad after the end of the existing features mixed so far.
         if current_num_frames < mix_num_frames:
-            existing_feats = np.vstack([
-                self.mixed_feats,
-                self.log_energy_floor * np.ones((mix_num_frames - current_num_frames, self.num_features))
-            ])
-
-        # When there is an offset, we need to pad before the start of the features we're adding.
-        if offset > 0:
-            feats_to_add = np.vstack([
-                self.log_energy_floor * np.ones((num_frames_offset, self.num_features)),
-                feats_to_add
-            ])
-
-        # When the features we're mixing in are shorter that the anticipated mix length,
-        # we need to pad after their end.
-        # Note: we're doing that non-efficiently, as it we potentially re-allocate numpy arrays twice,
-        # during this padding and the  offset padding before. If that's a bottleneck, we'll optimize.
-        if incoming_num_frames < mix_num_frames:
-            feats_to_add = np.vstack([
-                feats_to_add,
-                self.log_energy_floor * np.ones((mix_num_frames - incoming_num_frames, self.num_features))
-            ])
+            energies = np.empty((mix_num_frames, self.num_features), dtype=self._energies.dtype)
+            energies[:current_num_frames] = self._energies
+            energies[current_num_frames:] = floor_energy
+            self._energies = energies
+
+        feats_energies = np.exp(feats)
 
         # When SNR is requested, find what gain is needed to satisfy the SNR
         gain = 1.0
@@ -496,11 +530,17 @@ class FbankMixer:
             #    the signals to satisfy requested SNR
 
             # Compute the added signal energy before it was padded
-            added_feats_energy = fbank_energy(feats)
+            added_feats_energy = float(np.sum(feats_energies))
             target_energy = self.reference_energy * (10.0 ** (-snr / 10))
             gain = target_energy / added_feats_energy
 
-        self.mixed_feats = np.log(np.exp(existing_feats) + gain * np.exp(feats_to_add))
+        # Add the incoming features in place; the regions before their offset and after their end
+        # receive the (scaled) energy of the padding value.
+        self._energies[num_frames_offset: incoming_num_frames] += gain * feats_energies
+        if num_frames_offset > 0:
+            self._energies[:num_frames_offset] += gain * floor_energy
+        if incoming_num_frames < mix_num_frames:
+            self._energies[incoming_num_frames:] += gain * floor_energy
 
 
 def fbank_energy(fbank: np.ndarray) -> float:
@@ -528,3 +568,8 @@ def pad_shorter(
         return left_feats, np.vstack([right_feats, log_energy_floor * np.ones((size_diff, num_feats))])
     else:
         return np.vstack([left_feats, log_energy_floor * np.ones((size_diff, num_feats))]), right_feats
+
+
+def _check_not_jsonl(path: Pathlike):
+    if extension_contains('.jsonl', path):
+        raise ValueError(f'A FeatureSet cannot be stored as JSON Lines - use a .json or .yml manifest instead: {path}')
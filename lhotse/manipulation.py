@@ -1,22 +1,34 @@
+import gzip
 import random
 from functools import reduce
-from itertools import chain
+from itertools import chain, islice
 from math import ceil
 from operator import add
-from typing import List, TypeVar, Iterable, Any, Optional
+from typing import Dict, List, TypeVar, Iterable, Any, Optional, Type
+
+import yaml
 
 from lhotse.audio import RecordingSet, Recording
-from lhotse.cut import CutSet, Cut, MixedCut
+from lhotse.cut import CutSet, Cut, MixedCut, deserialize_cut
 from lhotse.features import FeatureSet, Features
 from lhotse.supervision import SupervisionSet, SupervisionSegment
-from lhotse.utils import Pathlike
+from lhotse.utils import Pathlike, extension_contains, load_json, load_jsonl
 
 ManifestItem = TypeVar('ManifestItem', Recording, SupervisionSegment, Features, Cut, MixedCut)
 Manifest = TypeVar('Manifest', RecordingSet, SupervisionSet, FeatureSet, CutSet)
 
 
-def split(manifest: Manifest, num_splits: int, randomize: bool = False) -> List[Manifest]:
-    """Split a manifest into `num_splits` equal parts. The element order can be randomized."""
+def split(
+        manifest: Manifest,
+        num_splits: int,
+        randomize: bool = False,
+        rng: Optional[random.Random] = None
+) -> List[Manifest]:
+    """
+    Split a manifest into `num_splits` equal parts. The element order can be randomized.
+    Optionally, pass a `random.Random` instance as `rng` to control the randomization
+    (the global `random` module is used by default).
+    """
     num_items = len(manifest)
     if num_splits > num_items:
         raise ValueError(f"Cannot split manifest into more chunks ({num_splits}) than its number of items {num_items}")
@@ -26,19 +38,26 @@ def split(manifest: Manifest, num_splits: int, randomize: bool = False) -> List[
     def maybe_randomize(items: Iterable[Any]) -> List[Any]:
         items = list(items)
         if randomize:
-            random.shuffle(items)
+            (rng if rng is not None else random).shuffle(items)
         return items
 
+    def split_dict(items: Dict[str, Any]) -> List[Dict[str, Any]]:
+        if not randomize:
+            # Read consecutive chunks directly from the dict, without materializing a list of all its items.
+            items_iter = iter(items.items())
+            return [dict(islice(items_iter, chunk_size)) for _ in range(num_splits)]
+        # Only shuffle the keys - the values are looked up in the original dict.
+        keys = maybe_randomize(items)
+        return [{key: items[key] for key in keys[begin: end]} for begin, end in split_indices]
+
     if isinstance(manifest, RecordingSet):
-        contents = maybe_randomize(manifest.recordings.items())
-        return [RecordingSet(recordings=dict(contents[begin: end])) for begin, end in split_indices]
+        return [RecordingSet(recordings=chunk) for chunk in split_dict(manifest.recordings)]
 
     if isinstance(manifest, SupervisionSet):
-        contents = maybe_randomize(manifest.segments.items())
-        return [SupervisionSet(segments=dict(contents[begin: end])) for begin, end in split_indices]
+        return [SupervisionSet(segments=chunk) for chunk in split_dict(manifest.segments)]
 
     if isinstance(manifest, FeatureSet):
-        contents = maybe_randomize(manifest.features)
+        contents = maybe_randomize(manifest.features) if randomize else manifest.features
         return [
             FeatureSet(
                 features=contents[begin: end],
@@ -48,17 +67,48 @@ def split(manifest: Manifest, num_splits: int, randomize: bool = False) -> List[
         ]
 
     if isinstance(manifest, CutSet):
-        contents = maybe_randomize(manifest.cuts.items())
-        return [CutSet(cuts=dict(contents[begin: end])) for begin, end in split_indices]
+        return [CutSet(cuts=chunk) for chunk in split_dict(manifest.cuts)]
 
     raise ValueError(f"Unknown type of manifest: {type(manifest)}")
 
 
 def combine(*manifests: Manifest) -> Manifest:
     """Combine multiple manifests of the same type into one."""
+    if len(manifests) < 2 or any(type(m) is not type(manifests[0]) for m in manifests):
+        return reduce(add, manifests)
+
+    # The result is the same as adding the manifests one by one, but we merge them in a single pass,
+    # without copying the growing intermediate manifests at each step.
+    first = manifests[0]
+
+    if isinstance(first, RecordingSet):
+        return RecordingSet(recordings=_merge_dicts(m.recordings for m in manifests))
+
+    if isinstance(first, SupervisionSet):
+        return SupervisionSet(segments=_merge_dicts(m.segments for m in manifests))
+
+    if isinstance(first, FeatureSet):
+        assert all(m.feature_extractor == first.feature_extractor for m in manifests)
+        return FeatureSet(
+            feature_extractor=first.feature_extractor,
+            features=list(chain.from_iterable(m.features for m in manifests))
+        )
+
+    if isinstance(first, CutSet):
+        cuts = _merge_dicts(m.cuts for m in manifests)
+        assert len(cuts) == sum(len(m.cuts) for m in manifests), "Conflicting IDs when concatenating CutSets!"
+        return CutSet(cuts=cuts)
+
     return reduce(add, manifests)
 
 
+def _merge_dicts(dicts: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    merged = {}
+    for d in dicts:
+        merged.update(d)
+    return merged
+
+
 def to_manifest(items: Iterable[ManifestItem]) -> Optional[Manifest]:
     """
     Take an iterable of data types in Lhotse such as Recording, SupervisonSegment or Cut, and create the manifest of the
@@ -85,7 +135,19 @@ def to_manifest(items: Iterable[ManifestItem]) -> Optional[Manifest]:
 
 
 def load_manifest(path: Pathlike) -> Manifest:
-    """Generic utility for reading an arbitrary manifest."""
+    """
+    Generic utility for reading an arbitrary manifest.
+    The format is inferred from the extension: JSON Lines (.jsonl, .jsonl.gz), JSON (.json, .json.gz) or YAML.
+    """
+    if extension_contains('.jsonl', path) or extension_contains('.json', path):
+        return _load_json_manifest(path)
+    manifest_type = _peek_manifest_type(path)
+    if manifest_type is not None:
+        try:
+            return manifest_type.from_yaml(path)
+        except Exception as e:
+            raise ValueError(f'Unknown type of manifest: {path}') from e
+    # Fall back to trying all the manifest types when the type could not be inferred from the file's beginning.
     data_set = None
     for manifest_type in [RecordingSet, SupervisionSet, FeatureSet, CutSet]:
         try:
@@ -95,3 +157,80 @@ def load_manifest(path: Pathlike) -> Manifest:
     if data_set is None:
         raise ValueError(f'Unknown type of manifest: {path}')
     return data_set
+
+
+# Re-create the manifest items from the dicts stored in JSON (Lines) manifests.
+_ITEM_DESERIALIZERS = {
+    RecordingSet: Recording.from_dict,
+    SupervisionSet: SupervisionSegment.from_dict,
+    CutSet: deserialize_cut,
+}
+
+
+def _load_json_manifest(path: Pathlike) -> Manifest:
+    """
+    Read a JSON or a JSON Lines manifest, parsing it only once: the type of the manifest is inferred
+    from the keys of the first item, and the remaining items are deserialized as they are read.
+    """
+    data = load_jsonl(path) if extension_contains('.jsonl', path) else load_json(path)
+    if isinstance(data, dict):
+        # A FeatureSet is the only manifest stored as a mapping.
+        return FeatureSet.from_dict(data)
+    items = iter(data)
+    try:
+        first_item = next(items)
+    except StopIteration:
+        raise ValueError(f'Unknown type of manifest: {path}')
+    manifest_type = _manifest_type_from_item_keys(first_item.keys())
+    if manifest_type is None:
+        raise ValueError(f'Unknown type of manifest: {path}')
+    return to_manifest(map(_ITEM_DESERIALIZERS[manifest_type], chain([first_item], items)))
+
+
+def _manifest_type_from_item_keys(keys: Iterable[str]) -> Optional[Type[Manifest]]:
+    keys = set(keys)
+    if 'tracks' in keys or 'features' in keys:
+        return CutSet
+    if 'sources' in keys:
+        return RecordingSet
+    if 'recording_id' in keys:
+        return SupervisionSet
+    return None
+
+
+def _peek_manifest_type(path: Pathlike) -> Optional[Type[Manifest]]:
+    """
+    Infer the type of a YAML manifest without parsing the whole file: a FeatureSet is the only manifest stored as
+    a mapping, and the other types are recognized by the keys of the first item in the list.
+    Returns None when the file can't be read or the type can't be inferred (e.g. an empty manifest).
+    """
+    try:
+        loader = yaml.CSafeLoader
+    except AttributeError:
+        loader = yaml.SafeLoader
+    opener = gzip.open if str(path).endswith('.gz') else open
+    try:
+        with opener(path, 'rt') as f:
+            first_item_keys = set()
+            depth = 0
+            expect_key = False
+            for event in yaml.parse(f, Loader=loader):
+                if isinstance(event, (yaml.MappingStartEvent, yaml.SequenceStartEvent)):
+                    if depth == 0 and isinstance(event, yaml.MappingStartEvent):
+                        return FeatureSet
+                    if depth == 2 and expect_key:
+                        break
+                    depth += 1
+                    expect_key = depth == 2
+                elif isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    depth -= 1
+                    if depth < 2:
+                        break
+                    expect_key = depth == 2
+                elif isinstance(event, yaml.ScalarEvent) and depth == 2:
+                    if expect_key:
+                        first_item_keys.add(event.value)
+                    expect_key = not expect_key
+    except (OSError, UnicodeDecodeError, yaml.YAMLError):
+        return None
+    return _manifest_type_from_item_keys(first_item_keys)
@@ -1,10 +1,14 @@
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, Union
+from typing import Dict, Sequence, Union
 
+import numpy as np
 import pandas as pd
 
 from lhotse.audio import RecordingSet, Recording, AudioSource
+from lhotse.manipulation import combine
 from lhotse.supervision import SupervisionSet, SupervisionSegment
 from lhotse.utils import Pathlike, Seconds
 
@@ -14,7 +18,8 @@ def prepare_librimix(
         output_dir: Pathlike,
         with_precomputed_mixtures: bool = False,
         sampling_rate: int = 16000,
-        min_segment_seconds: Seconds = 3.0
+        min_segment_seconds: Seconds = 3.0,
+        num_jobs: int = 1
 ) -> Dict[str, Dict[str, Union[RecordingSet, SupervisionSet]]]:
     df = pd.read_csv(librimix_csv)
 
@@ -23,30 +28,17 @@ def prepare_librimix(
 
     manifests = defaultdict(dict)
 
+    make_recordings = partial(
+        _make_recordings,
+        df,
+        sampling_rate=sampling_rate,
+        min_segment_seconds=min_segment_seconds,
+        num_jobs=num_jobs
+    )
+
     # First, create the audio manifest that specifies the pairs of source recordings
     # to be mixed together.
-    audio_sources = RecordingSet.from_recordings(
-        Recording(
-            id=row['mixture_ID'],
-            sources=[
-                AudioSource(
-                    type='file',
-                    channel_ids=[0],
-                    source=row['source_1_path']
-                ),
-                AudioSource(
-                    type='file',
-                    channel_ids=[1],
-                    source=row['source_2_path']
-                )
-            ],
-            sampling_rate=sampling_rate,
-            num_samples=int(row['length']),
-            duration_seconds=row['length'] / sampling_rate
-        )
-        for idx, row in df.iterrows()
-        if row['length'] / sampling_rate > min_segment_seconds
-    )
+    audio_sources = make_recordings(source_columns=('source_1_path', 'source_2_path'))
     audio_sources.to_yaml(output_dir / 'audio_sources.yml')
     supervision_sources = make_corresponding_supervisions(audio_sources)
     supervision_sources.to_yaml(output_dir / 'supervisions_sources.yml')
@@ -60,23 +52,7 @@ def prepare_librimix(
     # A different way of performing the mix would be using Lhotse's on-the-fly
     # overlaying of audio Cuts.
     if with_precomputed_mixtures:
-        audio_mix = RecordingSet.from_recordings(
-            Recording(
-                id=row['mixture_ID'],
-                sources=[
-                    AudioSource(
-                        type='file',
-                        channel_ids=[0],
-                        source=row['mixture_path']
-                    ),
-                ],
-                sampling_rate=sampling_rate,
-                num_samples=int(row['length']),
-                duration_seconds=row['length'] / sampling_rate
-            )
-            for idx, row in df.iterrows()
-            if row['length'] / sampling_rate > min_segment_seconds
-        )
+        audio_mix = make_recordings(source_columns=('mixture_path',))
         audio_mix.to_yaml(output_dir / 'audio_mix.yml')
         supervision_mix = make_corresponding_supervisions(audio_mix)
         supervision_mix.to_yaml(output_dir / 'supervisions_mix.yml')
@@ -88,23 +64,7 @@ def prepare_librimix(
     # When the LibriMix CSV specifies noises, we create a separate RecordingSet for them,
     # so that we can extract their features and overlay them as Cuts later.
     if 'noise_path' in df:
-        audio_noise = RecordingSet.from_recordings(
-            Recording(
-                id=row['mixture_ID'],
-                sources=[
-                    AudioSource(
-                        type='file',
-                        channel_ids=[0],
-                        source=row['noise_path']
-                    ),
-                ],
-                sampling_rate=sampling_rate,
-                num_samples=int(row['length']),
-                duration_seconds=row['length'] / sampling_rate
-            )
-            for idx, row in df.iterrows()
-            if row['length'] / sampling_rate > min_segment_seconds
-        )
+        audio_noise = make_recordings(source_columns=('noise_path',))
         audio_noise.to_yaml(output_dir / 'audio_noise.yml')
         supervision_noise = make_corresponding_supervisions(audio_noise)
         supervision_noise.to_yaml(output_dir / 'supervisions_noise.yml')
@@ -116,6 +76,59 @@ def prepare_librimix(
     return manifests
 
 
+def _make_recordings(
+        df: pd.DataFrame,
+        source_columns: Sequence[str],
+        sampling_rate: int,
+        min_segment_seconds: Seconds,
+        num_jobs: int = 1
+) -> RecordingSet:
+    """
+    Create a RecordingSet with one recording per row of the LibriMix CSV `df` that is longer than
+    `min_segment_seconds`. Each of the `source_columns` becomes an audio source on a separate channel.
+    With `num_jobs` > 1, the rows are split into chunks that are processed in parallel.
+    """
+    do_work = partial(
+        _make_recordings_chunk,
+        source_columns=source_columns,
+        sampling_rate=sampling_rate,
+        min_segment_seconds=min_segment_seconds
+    )
+    num_jobs = min(num_jobs, len(df))
+    # Avoid spawning subprocesses for single threaded processing
+    if num_jobs <= 1:
+        return do_work(df)
+    with ProcessPoolExecutor(num_jobs) as ex:
+        chunks = [df.iloc[indices] for indices in np.array_split(np.arange(len(df)), num_jobs)]
+        return combine(*ex.map(do_work, chunks))
+
+
+def _make_recordings_chunk(
+        df: pd.DataFrame,
+        source_columns: Sequence[str],
+        sampling_rate: int,
+        min_segment_seconds: Seconds
+) -> RecordingSet:
+    return RecordingSet.from_recordings(
+        Recording(
+            id=row['mixture_ID'],
+            sources=[
+                AudioSource(
+                    type='file',
+                    channel_ids=[channel],
+                    source=row[column]
+                )
+                for channel, column in enumerate(source_columns)
+            ],
+            sampling_rate=sampling_rate,
+            num_samples=int(row['length']),
+            duration_seconds=row['length'] / sampling_rate
+        )
+        for idx, row in df.iterrows()
+        if row['length'] / sampling_rate > min_segment_seconds
+    )
+
+
 def make_corresponding_supervisions(audio: RecordingSet) -> SupervisionSet:
     """
     Prepare a supervision set - in this case it just describes
@@ -1,7 +1,18 @@
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, replace
 from typing import Dict, Optional, Iterable
 
-from lhotse.utils import Seconds, Pathlike, asdict_nonull, load_yaml, save_to_yaml
+from lhotse.utils import (
+    Seconds,
+    Pathlike,
+    asdict_nonull,
+    load_yaml,
+    save_to_yaml,
+    extension_contains,
+    load_json,
+    save_to_json,
+    load_jsonl,
+    save_to_jsonl
+)
 
 
 @dataclass
@@ -21,9 +32,8 @@ class SupervisionSegment:
         return self.start + self.duration
 
     def with_offset(self, offset: Seconds) -> 'SupervisionSegment':
-        kwargs = asdict(self)
-        kwargs['start'] += offset
-        return SupervisionSegment(**kwargs)
+        # All the fields are immutable scalars, so a shallow replace() is enough (asdict() would deep-copy them).
+        return replace(self, start=self.start + offset)
 
     @staticmethod
     def from_dict(data: dict) -> 'SupervisionSegment':
@@ -46,15 +56,53 @@ class SupervisionSet:
     def from_segments(segments: Iterable[SupervisionSegment]) -> 'SupervisionSet':
         return SupervisionSet(segments={s.id: s for s in segments})
 
+    @staticmethod
+    def from_file(path: Pathlike) -> 'SupervisionSet':
+        """
+        Read a SupervisionSet from a JSON Lines (.jsonl, .jsonl.gz), a JSON (.json, .json.gz) or a YAML manifest,
+        depending on the extension.
+        """
+        if extension_contains('.jsonl', path):
+            return SupervisionSet.from_jsonl(path)
+        if extension_contains('.json', path):
+            return SupervisionSet.from_json(path)
+        return SupervisionSet.from_yaml(path)
+
     @staticmethod
     def from_yaml(path: Pathlike) -> 'SupervisionSet':
         raw_segments = load_yaml(path)
         return SupervisionSet.from_segments(SupervisionSegment.from_dict(s) for s in raw_segments)
 
+    @staticmethod
+    def from_json(path: Pathlike) -> 'SupervisionSet':
+        return SupervisionSet.from_segments(SupervisionSegment.from_dict(s) for s in load_json(path))
+
+    @staticmethod
+    def from_jsonl(path: Pathlike) -> 'SupervisionSet':
+        return SupervisionSet.from_segments(SupervisionSegment.from_dict(s) for s in load_jsonl(path))
+
+    def to_file(self, path: Pathlike):
+        """
+        Write the SupervisionSet as a JSON Lines (.jsonl, .jsonl.gz), a JSON (.json, .json.gz) or a YAML manifest,
+        depending on the extension.
+        """
+        if extension_contains('.jsonl', path):
+            self.to_jsonl(path)
+        elif extension_contains('.json', path):
+            self.to_json(path)
+        else:
+            self.to_yaml(path)
+
     def to_yaml(self, path: Pathlike):
         data = [asdict_nonull(s) for s in self]
         save_to_yaml(data, path)
 
+    def to_json(self, path: Pathlike):
+        save_to_json([asdict_nonull(s) for s in self], path)
+
+    def to_jsonl(self, path: Pathlike):
+        save_to_jsonl((asdict_nonull(s) for s in self), path)
+
     def __getitem__(self, item: str) -> SupervisionSegment:
         return self.segments[item]
 
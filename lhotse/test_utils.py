@@ -1,4 +1,6 @@
-from typing import Type
+import sys
+from functools import lru_cache
+from typing import Tuple, Type
 
 from lhotse.audio import RecordingSet, Recording
 from lhotse.cut import Cut
@@ -7,23 +9,39 @@ from lhotse.manipulation import Manifest
 from lhotse.supervision import SupervisionSet, SupervisionSegment
 
 
+# Note: the dummy_* functions are resolved when a builder is called, so they can be defined below.
+# noinspection PyTypeChecker
+_DUMMY_MANIFEST_BUILDERS = {
+    # The dicts are filled directly while creating the items, instead of collecting them into a list first.
+    RecordingSet: lambda begin_id, end_id: RecordingSet(
+        recordings={r.id: r for r in map(dummy_recording, range(begin_id, end_id))}
+    ),
+    SupervisionSet: lambda begin_id, end_id: SupervisionSet(
+        segments={s.id: s for s in map(dummy_supervision, range(begin_id, end_id))}
+    ),
+    FeatureSet: lambda begin_id, end_id: FeatureSet(
+        # A new list, as FeatureSet owns its list of features (the cached tuple is shared between the calls).
+        features=list(_dummy_features_range(begin_id, end_id)),
+        feature_extractor='irrelevant'
+    ),
+}
+
+
 # noinspection PyPep8Naming
 def DummyManifest(type_: Type, *, begin_id: int, end_id: int) -> Manifest:
-    if type_ == RecordingSet:
-        return RecordingSet.from_recordings(dummy_recording(idx) for idx in range(begin_id, end_id))
-    if type_ == SupervisionSet:
-        return SupervisionSet.from_segments(dummy_supervision(idx) for idx in range(begin_id, end_id))
-    if type_ == FeatureSet:
-        # noinspection PyTypeChecker
-        return FeatureSet(
-            features=[dummy_features(idx) for idx in range(begin_id, end_id)],
-            feature_extractor='irrelevant'
-        )
+    try:
+        build = _DUMMY_MANIFEST_BUILDERS[type_]
+    except KeyError:
+        raise ValueError(f"Unsupported type of dummy manifest: {type_}")
+    return build(begin_id, end_id)
 
 
+# The dummy objects are never modified, so the same instances can be shared between the calls
+# (e.g. the same range of IDs is requested by many parametrized tests).
+@lru_cache(maxsize=4096)
 def dummy_recording(unique_id: int) -> Recording:
     return Recording(
-        id=f'dummy-recording-{unique_id:04d}',
+        id=_dummy_id('dummy-recording', unique_id),
         sources=[],
         sampling_rate=16000,
         num_samples=16000,
@@ -33,16 +51,17 @@ def dummy_recording(unique_id: int) -> Recording:
 
 def dummy_supervision(unique_id: int, start: float = 0.0, duration: float = 1.0) -> SupervisionSegment:
     return SupervisionSegment(
-        id=f'dummy-segment-{unique_id:04d}',
-        recording_id=f'dummy-recording',
+        id=_dummy_id('dummy-segment', unique_id),
+        recording_id='dummy-recording',
         start=start,
         duration=duration
     )
 
 
+@lru_cache(maxsize=4096)
 def dummy_features(unique_id: int) -> Features:
     return Features(
-        recording_id=f'dummy-recording-{unique_id:04d}',
+        recording_id=_dummy_id('dummy-recording', unique_id),
         channel_id=0,
         start=0.0,
         duration=1.0,
@@ -62,3 +81,14 @@ def dummy_cut(id: str = 'irrelevant', start: float = 0.0, duration: float = 1.0,
         features=dummy_features(0),
         supervisions=supervisions if supervisions is not None else [],
     )
+
+
+@lru_cache(maxsize=8192)
+def _dummy_id(prefix: str, unique_id: int) -> str:
+    # Interned, so that e.g. a dummy recording and its dummy features share the same ID string object.
+    return sys.intern(prefix + '-' + str(unique_id).zfill(4))
+
+
+@lru_cache(maxsize=64)
+def _dummy_features_range(begin_id: int, end_id: int) -> Tuple[Features, ...]:
+    return tuple(dummy_features(idx) for idx in range(begin_id, end_id))
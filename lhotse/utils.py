@@ -1,14 +1,26 @@
 import gzip
+import hashlib
+import json
+import mmap
+import os
+import pickle
 import random
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, fields
+from functools import lru_cache
 from math import ceil, isclose
 from pathlib import Path
-from typing import Union, Any, Dict
+from typing import Union, Any, Dict, Iterable, Generator, Callable, TypeVar
 
 import numpy as np
 import torch
 import yaml
 
+try:
+    # When orjson is installed, it speeds up the JSON (de)serialization noticeably
+    import orjson
+except ImportError:
+    orjson = None
+
 Pathlike = Union[Path, str]
 
 Seconds = float
@@ -16,6 +28,8 @@ Decibels = float
 
 INT16MAX = 32768
 
+T = TypeVar('T')
+
 
 def fix_random_seed(random_seed: int):
     random.seed(random_seed)
@@ -45,6 +59,157 @@ def save_to_yaml(data: Any, path: Pathlike):
             return yaml.dump(data, stream=f, Dumper=yaml.SafeDumper)
 
 
+def save_to_yaml_streaming(data: Iterable[Any], path: Pathlike):
+    """
+    Write the items of `data` as a YAML list, consuming `data` lazily.
+    Each item is dumped as a single-element list - their concatenation is the same document
+    that `save_to_yaml` would have produced for the whole list.
+    """
+    compressed = str(path).endswith('.gz')
+    opener = gzip.open if compressed else open
+    mode = 'wt' if compressed else 'w'
+    try:
+        # When pyyaml is installed with C extensions, it can speed up the (de)serialization noticeably
+        dumper = yaml.CSafeDumper
+    except AttributeError:
+        dumper = yaml.SafeDumper
+    with opener(path, mode) as f:
+        is_empty = True
+        for item in data:
+            yaml.dump([item], stream=f, Dumper=dumper)
+            is_empty = False
+        if is_empty:
+            yaml.dump([], stream=f, Dumper=dumper)
+
+
+@lru_cache(maxsize=1)
+def _manifest_layout() -> str:
+    """
+    Fingerprint of the pickled representation of the cached manifests: the fields and `__slots__` of their classes.
+    Adding, removing or renaming a field changes it, so that the caches written by older versions of lhotse
+    are re-created instead of unpickled into objects missing some attributes.
+    """
+    # Imported here, as these modules depend on lhotse.utils.
+    from lhotse.audio import AudioSource, Recording, RecordingSet
+    from lhotse.features import (
+        FbankSpecificConfig,
+        FeatureExtractor,
+        FeatureSet,
+        Features,
+        MfccFbankCommonConfig,
+        MfccSpecificConfig,
+        SpectrogramConfig,
+    )
+    from lhotse.supervision import SupervisionSegment, SupervisionSet
+    classes = [
+        AudioSource, Recording, RecordingSet, SpectrogramConfig, MfccFbankCommonConfig, FbankSpecificConfig,
+        MfccSpecificConfig, FeatureExtractor, Features, FeatureSet, SupervisionSegment, SupervisionSet
+    ]
+    layout = [
+        (cls.__qualname__, [f.name for f in fields(cls)], list(vars(cls).get('__slots__', ())))
+        for cls in classes
+    ]
+    return hashlib.sha1(repr(layout).encode('utf-8')).hexdigest()
+
+
+def cached_load(path: Pathlike, loader: Callable[[Pathlike], T]) -> T:
+    """
+    Load the manifest at `path` with `loader` (e.g. `FeatureSet.from_file`), caching the result in a pickle
+    stored in `$XDG_CACHE_HOME/lhotse` (`~/.cache/lhotse` by default). Unpickling is much faster than parsing YAML,
+    which helps when the same manifest is used by several commands in a row.
+    There is one cache file per loader and manifest path; it's only used when it was created for the same
+    modification time and size of the manifest and the same layout of the manifest classes (see `_manifest_layout`),
+    otherwise it's re-created. A cache file that cannot be unpickled is treated as missing.
+    When the cache cannot be written, the manifest is just loaded.
+    Note: the cache files are never evicted - each one is a full copy of a manifest that was loaded.
+    Set the `LHOTSE_DISABLE_MANIFEST_CACHE` environment variable to a non-empty value to skip the cache entirely.
+    """
+    if os.environ.get('LHOTSE_DISABLE_MANIFEST_CACHE'):
+        return loader(path)
+    path = Path(path).resolve()
+    stat = path.stat()
+    loader_name = getattr(loader, '__qualname__', repr(loader))
+    key = (_manifest_layout(), stat.st_mtime_ns, stat.st_size)
+    cache_dir = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'lhotse'
+    cache_path = cache_dir / (hashlib.sha1(f'{loader_name}:{path}'.encode('utf-8')).hexdigest() + '.pkl')
+    try:
+        with open(cache_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            # The key is pickled separately, so that we don't unpickle stale data.
+            if pickle.load(data) == key:
+                return pickle.load(data)
+    except Exception:
+        # A corrupted cache or one written by an incompatible version of lhotse - just re-create it.
+        pass
+    data = loader(path)
+    tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(key, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path.exists():
+            tmp_path.unlink()
+    return data
+
+
+def extension_contains(ext: str, path: Pathlike) -> bool:
+    """
+    Check whether `ext` (e.g. '.jsonl') is the extension of `path`, ignoring a trailing '.gz'
+    (e.g. 'cuts.jsonl' and 'cuts.jsonl.gz' match, but 'cuts.jsonl.yml' does not).
+    """
+    path = Path(path)
+    if path.suffix == '.gz':
+        path = path.with_suffix('')
+    return path.suffix == ext
+
+
+def _json_dumps(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def load_json(path: Pathlike) -> Any:
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def save_to_json(data: Any, path: Pathlike):
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'wb') as f:
+        f.write(_json_dumps(data))
+
+
+def load_jsonl(path: Pathlike) -> Generator[Any, None, None]:
+    """
+    Lazily read a JSON Lines file, yielding one deserialized item per line.
+    Unlike `load_yaml`, it never holds more than a single item in memory.
+    """
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _json_loads(line)
+
+
+def save_to_jsonl(data: Iterable[Any], path: Pathlike):
+    """Write the items of `data` to a JSON Lines file, one item per line, consuming `data` lazily."""
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'wb') as f:
+        for item in data:
+            f.write(_json_dumps(item))
+            f.write(b'\n')
+
+
 def asdict_nonull(dclass) -> Dict[str, Any]:
     """
     Recursively convert a dataclass into a dict, removing all the fields with `None` value.
@@ -0,0 +1,51 @@
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import chain, count
+
+from cytoolz.itertoolz import partition_all
+
+from lhotse.bin.modes.cut import _bounded_map, _truncate_chunk
+from lhotse.test_utils import dummy_cut
+
+
+def _slow_identity(x):
+    # The earlier items finish later, so that the completion order differs from the input order.
+    time.sleep(0.01 * (5 - x % 5))
+    return x
+
+
+def test_bounded_map_keeps_the_order_and_bounds_the_items_in_flight():
+    max_in_flight = 3
+    consumed = []
+
+    def inputs():
+        for i in range(20):
+            consumed.append(i)
+            yield i
+
+    with ThreadPoolExecutor(4) as ex:
+        results = []
+        for result in _bounded_map(ex, _slow_identity, inputs(), max_in_flight=max_in_flight):
+            # The items read from the input, but not yielded yet, are the ones submitted to the executor.
+            assert len(consumed) - len(results) <= max_in_flight
+            results.append(result)
+    assert results == list(range(20))
+
+
+def test_truncate_chunks_give_the_same_cuts_in_serial_and_in_a_process_pool():
+    cuts = [dummy_cut(f'cut-{i}', duration=5.0 + i % 7) for i in range(50)]
+    do_work = partial(
+        _truncate_chunk,
+        max_duration=3.0,
+        offset_type='random',
+        keep_excessive_supervisions=False,
+        preserve_id=True
+    )
+    serial = list(chain.from_iterable(map(do_work, partition_all(8, cuts), count(42))))
+    with ProcessPoolExecutor(2) as ex:
+        parallel = list(chain.from_iterable(
+            _bounded_map(ex, do_work, partition_all(8, cuts), count(42), max_in_flight=4)
+        ))
+    assert serial == parallel
+    assert len({cut.start for cut in serial}) > 1
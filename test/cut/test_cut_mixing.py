@@ -1,10 +1,12 @@
 from contextlib import nullcontext as does_not_raise
+from functools import reduce
 from math import isclose
 
 import pytest
 
-from lhotse.cut import CutSet, MixedCut
+from lhotse.cut import CutSet, MixedCut, append, append_cuts, mix, mix_cuts
 from lhotse.supervision import SupervisionSegment
+from lhotse.test_utils import dummy_cut
 
 
 # Note:
@@ -55,3 +57,21 @@ def test_mixed_cut_load_features():
 
     feats = mixed_cut.load_features()
     assert feats.shape[0] == expected_frame_count
+
+
+@pytest.mark.parametrize(
+    ['combine_cuts', 'combine_two_cuts'],
+    [(mix_cuts, mix), (append_cuts, append)]
+)
+def test_combining_many_cuts_is_equivalent_to_folding(combine_cuts, combine_two_cuts):
+    cuts = [
+        dummy_cut('cut-0', duration=1.0),
+        dummy_cut('cut-1', duration=2.5),
+        dummy_cut('cut-2', duration=0.5).overlay(dummy_cut('cut-3', duration=3.0), offset_other_by=0.25),
+        dummy_cut('cut-4', duration=1.5),
+    ]
+    combined_cut = combine_cuts(cuts)
+    expected_cut = reduce(combine_two_cuts, cuts)
+
+    assert combined_cut.tracks == expected_cut.tracks
+    assert combined_cut.duration == expected_cut.duration
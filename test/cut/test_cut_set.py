@@ -41,3 +41,27 @@ def test_mixed_cut_set_serialization(cut_set_with_mixed_cut):
         cut_set_with_mixed_cut.to_yaml(f.name)
         restored = cut_set_with_mixed_cut.from_yaml(f.name)
     assert cut_set_with_mixed_cut == restored
+
+
+@pytest.mark.parametrize('suffix', ['.json', '.json.gz', '.jsonl', '.jsonl.gz'])
+def test_mixed_cut_set_json_serialization(cut_set_with_mixed_cut, suffix):
+    with NamedTemporaryFile(suffix=suffix) as f:
+        cut_set_with_mixed_cut.to_file(f.name)
+        restored = CutSet.from_file(f.name)
+    assert cut_set_with_mixed_cut == restored
+
+
+@pytest.mark.parametrize('suffix', ['.yml', '.json', '.jsonl'])
+def test_cut_set_iter_from_file(cut_set_with_mixed_cut, suffix):
+    with NamedTemporaryFile(suffix=suffix) as f:
+        cut_set_with_mixed_cut.to_file(f.name)
+        cuts = list(CutSet.iter_from_file(f.name))
+    assert cuts == list(cut_set_with_mixed_cut)
+
+
+@pytest.mark.parametrize('suffix', ['.yml', '.yml.gz', '.json', '.jsonl', '.jsonl.gz'])
+def test_cut_set_write_streaming(cut_set_with_mixed_cut, suffix):
+    with NamedTemporaryFile(suffix=suffix) as f:
+        CutSet.write_streaming(f.name, iter(cut_set_with_mixed_cut))
+        restored = CutSet.from_file(f.name)
+    assert cut_set_with_mixed_cut == restored
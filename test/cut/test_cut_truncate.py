@@ -1,8 +1,11 @@
+import os
+import random
 from math import isclose
 
 import pytest
 
-from lhotse.cut import Cut, MixedCut, MixTrack
+from lhotse._cut_kernels import get_truncate_tracks
+from lhotse.cut import Cut, MixedCut, MixTrack, truncate_cut, _new_id
 from lhotse.features import Features
 from lhotse.supervision import SupervisionSegment
 from lhotse.test_utils import dummy_cut
@@ -62,14 +65,19 @@ def overlapping_supervisions_cut():
         (0.27, 0.04, False, 0.31, []),
     ]
 )
+@pytest.mark.parametrize('vectorized', [False, True])
 def test_truncate_cut(
         offset,
         duration,
         keep_excessive_supervisions,
         expected_end,
         expected_supervision_ids,
-        overlapping_supervisions_cut
+        overlapping_supervisions_cut,
+        vectorized,
+        monkeypatch
 ):
+    if vectorized:
+        monkeypatch.setattr('lhotse.cut._VECTORIZED_SUPERVISIONS_MIN_COUNT', 0)
     truncated_cut = overlapping_supervisions_cut.truncate(
         offset=offset,
         duration=duration,
@@ -176,6 +184,28 @@ def test_truncate_mixed_cut_with_small_offset_and_duration(simple_mixed_cut):
     assert truncated_cut.duration == 13.0
 
 
+@pytest.mark.skipif(get_truncate_tracks() is None, reason='Requires numba.')
+@pytest.mark.parametrize(
+    ['offset', 'duration'],
+    [(0.0, None), (3.3, 20.0), (1.0, 13.0), (7.5, 2.0), (20.0, 15.0)]
+)
+def test_truncate_mixed_cut_with_many_tracks_matches_python_loop(offset, duration, monkeypatch):
+    mixed_cut = MixedCut(
+        id='many-tracks-mixed-cut',
+        tracks=[MixTrack(cut=dummy_cut(f'cut{i}', duration=10.0), offset=i * 0.7) for i in range(40)]
+    )
+    truncated_cut = mixed_cut.truncate(offset=offset, duration=duration)
+    monkeypatch.setattr('lhotse.cut._TRUNCATE_KERNEL_MIN_TRACKS', len(mixed_cut.tracks) + 1)
+    expected_cut = mixed_cut.truncate(offset=offset, duration=duration)
+
+    assert len(truncated_cut.tracks) == len(expected_cut.tracks)
+    for track, expected_track in zip(truncated_cut.tracks, expected_cut.tracks):
+        assert track.offset == expected_track.offset
+        assert track.cut.start == expected_track.cut.start
+        assert track.cut.duration == expected_track.cut.duration
+    assert truncated_cut.duration == expected_cut.duration
+
+
 def test_truncate_cut_set_offset_start(cut_set):
     truncated_cut_set = cut_set.truncate(max_duration=5, offset_type='start')
     cut1, cut2 = truncated_cut_set
@@ -210,3 +240,43 @@ def test_truncate_cut_set_offset_random(cut_set):
     # Check that start and end is not the same in every cut
     assert len(set(cut.start for cut in truncated_cut_set)) > 1
     assert len(set(cut.end for cut in truncated_cut_set)) > 1
+
+
+def test_truncate_cut_does_not_modify_shorter_cut(cut1):
+    assert truncate_cut(cut1, max_duration=15, offset_type='random') is cut1
+
+
+def test_truncate_cut_offset_random_is_reproducible_with_rng(cut1):
+    truncated_cuts = [
+        truncate_cut(cut1, max_duration=5, offset_type='random', rng=random.Random(1337))
+        for _ in range(2)
+    ]
+    assert truncated_cuts[0].start == truncated_cuts[1].start
+    assert isclose(truncated_cuts[0].duration, 5.0)
+
+
+def test_truncated_cuts_get_distinct_ids():
+    cut = dummy_cut('cut', duration=10.0)
+    ids = [cut.truncate(offset=0.0, duration=5.0).id for _ in range(100)]
+    assert len(set(ids)) == 100
+    assert 'cut' not in ids
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='Requires os.fork.')
+def test_new_cut_ids_differ_between_forked_processes():
+    read_fd, write_fd = os.pipe()
+    parent_id = _new_id()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write_fd, _new_id().encode('utf-8'))
+        finally:
+            os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd) as f:
+        child_id = f.read()
+    os.waitpid(pid, 0)
+    # The counter is inherited by the child, so only a different prefix keeps the IDs from clashing.
+    parent_prefix, child_prefix = parent_id.rsplit('-', 1)[0], child_id.rsplit('-', 1)[0]
+    assert child_prefix != parent_prefix
+    assert _new_id().rsplit('-', 1)[0] == parent_prefix
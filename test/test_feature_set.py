@@ -7,7 +7,7 @@ from pytest import mark, raises
 
 from lhotse.audio import RecordingSet
 from lhotse.features import FeatureSet, FeatureExtractor, Features, FbankMixer, FeatureSetBuilder
-from lhotse.test_utils import DummyManifest
+from lhotse.test_utils import DummyManifest, dummy_features
 from lhotse.utils import Seconds, time_diff_to_num_frames
 
 other_params = {}
@@ -70,6 +70,28 @@ def test_feature_set_serialization():
     assert feature_set_deserialized == feature_set
 
 
+@mark.parametrize('suffix', ['.yml', '.json', '.json.gz'])
+def test_feature_set_serialization_by_extension(suffix):
+    feature_set = FeatureSet(
+        feature_extractor=FeatureExtractor(),
+        features=DummyManifest(FeatureSet, begin_id=0, end_id=10).features
+    )
+    with NamedTemporaryFile(suffix=suffix) as f:
+        feature_set.to_file(f.name)
+        feature_set_deserialized = FeatureSet.from_file(f.name)
+    assert feature_set_deserialized == feature_set
+
+
+@mark.parametrize('suffix', ['.jsonl', '.jsonl.gz'])
+def test_feature_set_cannot_be_stored_as_jsonl(suffix):
+    feature_set = DummyManifest(FeatureSet, begin_id=0, end_id=10)
+    with NamedTemporaryFile(suffix=suffix) as f:
+        with raises(ValueError):
+            feature_set.to_file(f.name)
+        with raises(ValueError):
+            FeatureSet.from_file(f.name)
+
+
 @mark.parametrize(
     ['recording_id', 'channel', 'start', 'duration', 'exception_expectation'],
     [
@@ -183,3 +205,36 @@ def test_overlay_fbank():
     fmix_time = feature_extractor.extract(x1 + x2, 8000).numpy()
 
     np.testing.assert_almost_equal(fmix_feat, fmix_time, decimal=0)
+
+
+def test_fbank_mixer_matches_the_closed_form_of_the_mix():
+    rng = np.random.RandomState(0)
+    frame_shift = 0.01
+    floor = -10.0
+    a = rng.randn(10, 4).astype(np.float32)
+    b = rng.randn(12, 4).astype(np.float32)
+    c = rng.randn(5, 4).astype(np.float32)
+
+    mixer = FbankMixer(base_feats=a, frame_shift=frame_shift, log_energy_floor=floor)
+    # The track starts 3 frames after the mix and extends 5 frames past its end.
+    mixer.add_to_mix(b, snr=10.0, offset=3 * frame_shift)
+    # The track is shorter than the mix.
+    mixer.add_to_mix(c, offset=2 * frame_shift)
+
+    def pad(feats, before, total):
+        return np.vstack([
+            np.full((before, feats.shape[1]), floor),
+            feats,
+            np.full((total - before - feats.shape[0], feats.shape[1]), floor)
+        ])
+
+    gain = np.sum(np.exp(a.astype(np.float64))) * 10 ** (-10.0 / 10) / np.sum(np.exp(b.astype(np.float64)))
+    expected = np.log(np.exp(pad(a, 0, 15)) + gain * np.exp(pad(b, 3, 15)))
+    expected = np.log(np.exp(expected) + np.exp(pad(c, 2, 15)))
+
+    assert mixer.mixed_feats.dtype == np.float64
+    np.testing.assert_allclose(mixer.mixed_feats, expected, rtol=1e-5, atol=1e-6)
+
+
+def test_features_have_no_instance_dict():
+    assert not hasattr(dummy_features(0), '__dict__')
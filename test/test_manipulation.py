@@ -1,13 +1,16 @@
+import random
 from contextlib import nullcontext as does_not_raise
 
 import pytest
 from pytest import mark, raises
 
 from lhotse.audio import RecordingSet
+from lhotse.cut import CutSet
 from lhotse.features import FeatureSet
 from lhotse.manipulation import split, combine, load_manifest
 from lhotse.supervision import SupervisionSet
-from lhotse.test_utils import DummyManifest
+from lhotse.test_utils import DummyManifest, dummy_cut
+from lhotse.utils import load_yaml, save_to_yaml, save_to_json, save_to_jsonl
 
 
 @mark.parametrize('manifest_type', [RecordingSet, SupervisionSet, FeatureSet])
@@ -29,6 +32,14 @@ def test_split_odd(manifest_type):
     assert manifest_subsets[2] == DummyManifest(manifest_type, begin_id=68, end_id=100)
 
 
+@mark.parametrize('manifest_type', [RecordingSet, SupervisionSet, FeatureSet])
+def test_split_randomized_with_rng_is_reproducible(manifest_type):
+    manifest = DummyManifest(manifest_type, begin_id=0, end_id=100)
+    first_subsets = split(manifest, num_splits=2, randomize=True, rng=random.Random(1337))
+    second_subsets = split(manifest, num_splits=2, randomize=True, rng=random.Random(1337))
+    assert first_subsets == second_subsets
+
+
 @mark.parametrize('manifest_type', [RecordingSet, SupervisionSet, FeatureSet])
 def test_cannot_split_to_more_chunks_than_items(manifest_type):
     manifest = DummyManifest(manifest_type, begin_id=0, end_id=1)
@@ -47,6 +58,18 @@ def test_combine(manifest_type):
     assert combined == expected
 
 
+def test_combine_cut_sets():
+    cuts = [dummy_cut(f'cut-{idx}') for idx in range(5)]
+    combined = combine(CutSet.from_cuts(cuts[:2]), CutSet.from_cuts(cuts[2:3]), CutSet.from_cuts(cuts[3:]))
+    assert combined == CutSet.from_cuts(cuts)
+
+
+def test_combine_cut_sets_with_conflicting_ids_raises():
+    cuts = [dummy_cut(f'cut-{idx}') for idx in range(3)]
+    with raises(AssertionError):
+        combine(CutSet.from_cuts(cuts[:2]), CutSet.from_cuts(cuts[2:]), CutSet.from_cuts(cuts[1:2]))
+
+
 @mark.parametrize(
     ['path', 'exception_expectation'],
     [
@@ -60,3 +83,34 @@ def test_combine(manifest_type):
 def test_load_any_lhotse_manifest(path, exception_expectation):
     with exception_expectation:
         load_manifest(path)
+
+
+@mark.parametrize(
+    ['path', 'manifest_type'],
+    [
+        ('test/fixtures/audio.yml', RecordingSet),
+        ('test/fixtures/supervision.yml', SupervisionSet),
+        ('test/fixtures/dummy_feats/feature_manifest.yml', FeatureSet),
+        ('test/fixtures/libri/cuts.yml', CutSet),
+        ('test/fixtures/mix_cut_test/overlayed_cut_manifest.yml', CutSet),
+    ]
+)
+@mark.parametrize('suffix', ['.yml', '.yml.gz', '.json', '.json.gz', '.jsonl', '.jsonl.gz'])
+def test_load_manifest_returns_the_right_type(path, manifest_type, suffix, tmp_path):
+    manifest = load_manifest(path)
+    converted_path = tmp_path / f'manifest{suffix}'
+    if suffix.startswith('.yml'):
+        save_to_yaml(load_yaml(path), converted_path)
+    elif manifest_type is FeatureSet and suffix.startswith('.jsonl'):
+        pytest.skip('A FeatureSet cannot be stored as JSON Lines.')
+    elif manifest_type is RecordingSet:
+        # RecordingSet has no JSON writers, so we convert the raw data.
+        if suffix.startswith('.jsonl'):
+            save_to_jsonl(load_yaml(path), converted_path)
+        else:
+            save_to_json(load_yaml(path), converted_path)
+    else:
+        manifest.to_file(converted_path)
+    loaded = load_manifest(converted_path)
+    assert isinstance(loaded, manifest_type)
+    assert loaded == manifest
@@ -6,7 +6,7 @@ import numpy as np
 from pytest import mark, raises
 
 from lhotse.audio import RecordingSet, Recording, AudioSource
-from lhotse.test_utils import DummyManifest
+from lhotse.test_utils import DummyManifest, dummy_recording
 from lhotse.utils import INT16MAX
 
 
@@ -143,3 +143,7 @@ def test_add_audio_sets():
     audio_set_2 = DummyManifest(RecordingSet, begin_id=5, end_id=10)
     combined = audio_set_1 + audio_set_2
     assert combined == expected
+
+
+def test_recording_has_no_instance_dict():
+    assert not hasattr(dummy_recording(0), '__dict__')
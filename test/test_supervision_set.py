@@ -1,6 +1,8 @@
 from functools import lru_cache
 from tempfile import NamedTemporaryFile
 
+import pytest
+
 from lhotse.supervision import SupervisionSet, SupervisionSegment
 from lhotse.test_utils import DummyManifest
 
@@ -87,6 +89,15 @@ def test_supervision_set_serialization():
     assert supervision_set == restored
 
 
+@pytest.mark.parametrize('suffix', ['.yml', '.json', '.json.gz', '.jsonl', '.jsonl.gz'])
+def test_supervision_set_serialization_by_extension(suffix):
+    supervision_set = DummyManifest(SupervisionSet, begin_id=0, end_id=10)
+    with NamedTemporaryFile(suffix=suffix) as f:
+        supervision_set.to_file(f.name)
+        restored = SupervisionSet.from_file(f.name)
+    assert supervision_set == restored
+
+
 def test_add_supervision_sets():
     expected = DummyManifest(SupervisionSet, begin_id=0, end_id=10)
     supervision_set_1 = DummyManifest(SupervisionSet, begin_id=0, end_id=5)
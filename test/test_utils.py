@@ -1,9 +1,20 @@
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 
 import pytest
 
-from lhotse.utils import overlaps, TimeSpan, overspans, save_to_yaml, load_yaml
+from lhotse.utils import (
+    overlaps,
+    TimeSpan,
+    overspans,
+    save_to_yaml,
+    load_yaml,
+    save_to_jsonl,
+    load_jsonl,
+    save_to_yaml_streaming,
+    cached_load,
+    extension_contains
+)
 
 
 @pytest.mark.parametrize(
@@ -55,3 +66,106 @@ def test_yaml_save_load_roundtrip(extension):
         f.flush()
         data_deserialized = load_yaml(path)
     assert data == data_deserialized
+
+
+@pytest.mark.parametrize('extension', ['.jsonl', '.jsonl.gz'])
+def test_jsonl_save_load_roundtrip(extension):
+    data = [{'some': ['data']}, {'other': 1.5}]
+    with NamedTemporaryFile() as f:
+        path = Path(f.name).with_suffix(extension)
+        save_to_jsonl(data, path)
+        f.flush()
+        data_deserialized = list(load_jsonl(path))
+    assert data == data_deserialized
+
+
+@pytest.mark.parametrize('data', [[], [{'some': ['data']}, {'other': {'nested': 1.5}}]])
+def test_yaml_streaming_save_is_equivalent_to_save(data):
+    with NamedTemporaryFile() as f, NamedTemporaryFile() as f_streaming:
+        save_to_yaml(data, f.name)
+        save_to_yaml_streaming(iter(data), f_streaming.name)
+        assert f.read() == f_streaming.read()
+        assert load_yaml(f_streaming.name) == data
+
+
+def test_cached_load_reuses_the_cache_until_the_manifest_changes(monkeypatch):
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        return load_yaml(path)
+
+    with TemporaryDirectory() as d, TemporaryDirectory() as cache_dir:
+        monkeypatch.setenv('XDG_CACHE_HOME', cache_dir)
+        path = Path(d) / 'manifest.yml'
+        save_to_yaml({'some': ['data']}, path)
+        assert cached_load(path, loader) == {'some': ['data']}
+        assert cached_load(path, loader) == {'some': ['data']}
+        assert len(calls) == 1
+        save_to_yaml({'some': ['other', 'data']}, path)
+        assert cached_load(path, loader) == {'some': ['other', 'data']}
+        assert len(calls) == 2
+        assert len(list((Path(cache_dir) / 'lhotse').glob('*.pkl'))) == 1
+
+
+def test_cached_load_recreates_an_unreadable_cache(monkeypatch):
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        return load_yaml(path)
+
+    with TemporaryDirectory() as d, TemporaryDirectory() as cache_dir:
+        monkeypatch.setenv('XDG_CACHE_HOME', cache_dir)
+        path = Path(d) / 'manifest.yml'
+        save_to_yaml({'some': ['data']}, path)
+        assert cached_load(path, loader) == {'some': ['data']}
+        cache_path, = (Path(cache_dir) / 'lhotse').glob('*.pkl')
+        cache_path.write_bytes(b'not a pickle')
+        assert cached_load(path, loader) == {'some': ['data']}
+        assert cached_load(path, loader) == {'some': ['data']}
+        assert len(calls) == 2
+
+
+def test_cached_load_recreates_the_cache_when_the_manifest_layout_changes(monkeypatch):
+    calls = []
+
+    def loader(path):
+        calls.append(path)
+        return load_yaml(path)
+
+    with TemporaryDirectory() as d, TemporaryDirectory() as cache_dir:
+        monkeypatch.setenv('XDG_CACHE_HOME', cache_dir)
+        path = Path(d) / 'manifest.yml'
+        save_to_yaml({'some': ['data']}, path)
+        assert cached_load(path, loader) == {'some': ['data']}
+        monkeypatch.setattr('lhotse.utils._manifest_layout', lambda: 'a-new-field-was-added')
+        assert cached_load(path, loader) == {'some': ['data']}
+        assert cached_load(path, loader) == {'some': ['data']}
+        assert len(calls) == 2
+
+
+def test_cached_load_can_be_disabled(monkeypatch):
+    with TemporaryDirectory() as d, TemporaryDirectory() as cache_dir:
+        monkeypatch.setenv('XDG_CACHE_HOME', cache_dir)
+        monkeypatch.setenv('LHOTSE_DISABLE_MANIFEST_CACHE', '1')
+        path = Path(d) / 'manifest.yml'
+        save_to_yaml({'some': ['data']}, path)
+        assert cached_load(path, load_yaml) == {'some': ['data']}
+        assert not (Path(cache_dir) / 'lhotse').exists()
+
+
+@pytest.mark.parametrize(
+    ['ext', 'path', 'expected'],
+    [
+        ('.jsonl', 'cuts.jsonl', True),
+        ('.jsonl', 'cuts.jsonl.gz', True),
+        ('.jsonl', 'data.v1/cuts.jsonl', True),
+        ('.json', 'cuts.jsonl', False),
+        ('.jsonl', 'cuts.jsonl.yml', False),
+        ('.json', 'train.json.bak.yml', False),
+        ('.json', 'cuts.yml.gz', False),
+    ]
+)
+def test_extension_contains(ext, path, expected):
+    assert extension_contains(ext, path) == expected